@@ -0,0 +1,85 @@
+import base64
+from queue import Queue
+
+import click
+import pytest
+
+from schemathesis.cli.cassettes import (
+    CassetteIndex,
+    Finalize,
+    Initialize,
+    Process,
+    filter_cassette,
+    filter_index,
+    iter_indexed_interactions,
+    iter_interactions,
+    vcr_writer,
+)
+from schemathesis.generation import DataGenerationMethod
+from schemathesis.models import Request, Response, Status
+from schemathesis.runner.serialization import SerializedInteraction
+
+INTERACTIONS_NUM = 5000
+BODY = base64.b64encode(b'{"id": 42, "name": "Test"}').decode()
+
+
+def make_interaction(idx: int) -> SerializedInteraction:
+    return SerializedInteraction(
+        request=Request(
+            method="POST",
+            uri=f"http://127.0.0.1/api/items/{idx}",
+            body=BODY,
+            body_size=None,
+            headers={"Content-Type": ["application/json"]},
+        ),
+        response=Response(
+            status_code=500 if idx % 100 == 0 else 200,
+            message="OK",
+            headers={"Content-Type": ["application/json"]},
+            body=BODY,
+            body_size=None,
+            encoding="utf-8",
+            http_version="1.1",
+            elapsed=0.1,
+            verify=True,
+        ),
+        checks=[],
+        status=Status.failure if idx % 100 == 0 else Status.success,
+        data_generation_method=DataGenerationMethod.positive,
+        phase=None,
+        description=None,
+        recorded_at="2024-01-01T00:00:00",
+    )
+
+
+@pytest.fixture(scope="module")
+def cassette_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("cassettes") / "cassette.yaml"
+    queue: Queue = Queue()
+    queue.put(Initialize(seed=1))
+    queue.put(
+        Process(
+            correlation_id="",
+            thread_id=1,
+            interactions=[make_interaction(idx) for idx in range(INTERACTIONS_NUM)],
+            operation="POST /api/items/{id}",
+        )
+    )
+    queue.put(Finalize())
+    vcr_writer(click.utils.LazyFile(str(path), "w", encoding="utf-8"), False, queue, index=True)
+    return str(path)
+
+
+@pytest.mark.benchmark
+def test_filter_by_status_scan(cassette_path):
+    with open(cassette_path, "rb") as fd:
+        for _ in filter_cassette(iter_interactions(fd), status="FAILURE"):
+            pass
+
+
+@pytest.mark.benchmark
+def test_filter_by_status_index(cassette_path):
+    index = CassetteIndex.load(cassette_path)
+    with open(cassette_path, "rb") as fd:
+        for _ in iter_indexed_interactions(fd, filter_index(index.iter_entries(), status="FAILURE")):
+            pass
@@ -0,0 +1,107 @@
+import datetime
+import io
+
+import pytest
+import requests
+from urllib3 import HTTPResponse
+from werkzeug.test import Client
+from werkzeug.wrappers import Request as WerkzeugRequest
+from werkzeug.wrappers import Response as WerkzeugResponse
+
+import schemathesis
+from schemathesis.constants import SCHEMATHESIS_TEST_CASE_HEADER
+from schemathesis.models import Interaction, Status
+
+RAW_SCHEMA = {
+    "openapi": "3.0.2",
+    "info": {"title": "Test", "description": "Test", "version": "0.1.0"},
+    "paths": {
+        "/users/{user_id}": {
+            "post": {
+                "parameters": [
+                    {"name": "user_id", "in": "path", "required": True, "schema": {"type": "integer"}},
+                    {"name": "q", "in": "query", "required": True, "schema": {"type": "string"}},
+                    {"name": "X-Token", "in": "header", "required": True, "schema": {"type": "string"}},
+                ],
+                "requestBody": {
+                    "required": True,
+                    "content": {"application/json": {"schema": {"type": "object"}}},
+                },
+                "responses": {"200": {"description": "OK"}},
+            }
+        }
+    },
+}
+SCHEMA = schemathesis.from_dict(RAW_SCHEMA, base_url="http://127.0.0.1:8080/api")
+OPERATION = SCHEMA["/users/{user_id}"]["POST"]
+CASES = [
+    OPERATION.make_case(
+        path_parameters={"user_id": idx},
+        query={"q": f"value-{idx}"},
+        headers={"X-Token": "secret"},
+        body={"id": idx, "name": "John", "tags": ["a", "b"], "address": {"city": "Prague", "zip": None}},
+        media_type="application/json",
+    )
+    for idx in range(100)
+]
+
+
+@pytest.mark.benchmark
+def test_case_hash():
+    for case in CASES:
+        # Avoid measuring the memoized value
+        case._fingerprint = None
+        hash(case)
+
+
+@pytest.mark.benchmark
+def test_case_hash_curl():
+    # Baseline: the previous approach hashed a rendered curl command
+    for case in CASES:
+        hash(case.as_curl_command({SCHEMATHESIS_TEST_CASE_HEADER: "0"}))
+
+
+# A typical JSON payload of a few kilobytes
+RESPONSE_BODY = b'{"items": [' + b", ".join(b'{"id": %d, "name": "John"}' % idx for idx in range(100)) + b"]}"
+
+
+def make_response(case):
+    kwargs = case.as_transport_kwargs(base_url="http://127.0.0.1:8080/api")
+    prepared = requests.Session().prepare_request(requests.Request(**kwargs))
+    headers = {"Content-Type": "application/json", "Content-Length": str(len(RESPONSE_BODY))}
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.raw = HTTPResponse(body=io.BytesIO(RESPONSE_BODY), headers=headers, status=200, preload_content=False)
+    response.headers.update(headers)
+    response.encoding = "utf-8"
+    response.elapsed = datetime.timedelta(seconds=0.1)
+    response.request = prepared
+    # Read the payload, as it is done after sending a request
+    _ = response.content
+    return response
+
+
+RESPONSES = [(case, make_response(case)) for case in CASES]
+
+
+@pytest.mark.benchmark
+def test_interaction_from_requests():
+    for case, response in RESPONSES:
+        Interaction.from_requests(case, response, Status.success, [], None, None)
+
+
+@WerkzeugRequest.application
+def wsgi_app(request):
+    return WerkzeugResponse(RESPONSE_BODY, content_type="application/json")
+
+
+WSGI_RESPONSE = Client(wsgi_app).get("/")
+WSGI_HEADERS = {"User-Agent": "schemathesis", SCHEMATHESIS_TEST_CASE_HEADER: "0"}
+
+
+@pytest.mark.benchmark
+def test_interaction_from_wsgi():
+    # Recording overhead per case with `--cassette-path` for WSGI apps
+    for case in CASES:
+        Interaction.from_wsgi(case, WSGI_RESPONSE, WSGI_HEADERS, 0.1, Status.success, [])
@@ -0,0 +1,92 @@
+import hypothesis
+import pytest
+from hypothesis import HealthCheck, Phase, Verbosity
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+import schemathesis
+from schemathesis.runner import from_schema
+
+# Many trivial operations, so the benchmark measures the runner overhead rather than data generation
+OPERATIONS_NUM = 200
+RAW_SCHEMA = {
+    "openapi": "3.0.2",
+    "info": {"title": "Test", "version": "0.1.0"},
+    "paths": {
+        f"/items/{idx}": {"get": {"responses": {"200": {"description": "OK"}}}} for idx in range(OPERATIONS_NUM)
+    },
+}
+SCHEMA = schemathesis.from_dict(RAW_SCHEMA, base_url="http://127.0.0.1:1")
+HYPOTHESIS_SETTINGS = hypothesis.settings(
+    deadline=None,
+    database=None,
+    max_examples=1,
+    derandomize=True,
+    suppress_health_check=list(HealthCheck),
+    phases=[Phase.explicit, Phase.generate],
+    verbosity=Verbosity.quiet,
+)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("workers_num", [1, 8, 32])
+def test_runner_overhead(workers_num):
+    # No requests are sent in dry run mode
+    runner = from_schema(
+        SCHEMA,
+        checks=(),
+        workers_num=workers_num,
+        dry_run=True,
+        count_operations=False,
+        count_links=False,
+        hypothesis_settings=HYPOTHESIS_SETTINGS,
+    )
+    for _ in runner.execute():
+        pass
+
+
+async def get_item(request):
+    return JSONResponse({"id": request.path_params["item_id"]})
+
+
+ASGI_OPERATIONS_NUM = 10
+ASGI_APP = Starlette(routes=[Route("/{group}/items/{item_id:int}", get_item)])
+ASGI_SCHEMA = schemathesis.from_dict(
+    {
+        "openapi": "3.0.2",
+        "info": {"title": "Test", "version": "0.1.0"},
+        "paths": {
+            f"/group-{idx}/items/{{item_id}}": {
+                "get": {
+                    "parameters": [
+                        {
+                            "name": "item_id",
+                            "in": "path",
+                            "required": True,
+                            "schema": {"type": "integer", "minimum": 0},
+                        }
+                    ],
+                    "responses": {"200": {"description": "OK"}},
+                }
+            }
+            for idx in range(ASGI_OPERATIONS_NUM)
+        },
+    },
+    app=ASGI_APP,
+)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("workers_num", [1, 4])
+def test_asgi_runner(workers_num):
+    runner = from_schema(
+        ASGI_SCHEMA,
+        checks=(),
+        workers_num=workers_num,
+        count_operations=False,
+        count_links=False,
+        hypothesis_settings=HYPOTHESIS_SETTINGS.__class__(HYPOTHESIS_SETTINGS, max_examples=20),
+    )
+    for _ in runner.execute():
+        pass
@@ -1,12 +1,16 @@
+import itertools
 import pathlib
 import sys
+from contextlib import suppress
 
 import hypothesis
 import pytest
+import requests
 from hypothesis import HealthCheck, Phase, Verbosity
 
 import schemathesis
 from schemathesis.internal.copy import fast_deepcopy
+from schemathesis.internal.result import Ok
 from schemathesis.runner import from_schema
 
 CURRENT_DIR = pathlib.Path(__file__).parent.absolute()
@@ -243,3 +247,28 @@ def test_links_count(raw_schema):
 )
 def test_deepcopy(schema):
     fast_deepcopy(schema)
+
+
+def _make_json_response(content: bytes = b"{}", status_code: int = 200) -> requests.Response:
+    response = requests.Response()
+    response._content = content
+    response.status_code = status_code
+    response.headers["Content-Type"] = "application/json"
+    return response
+
+
+JSON_RESPONSE = _make_json_response()
+VMWARE_RESPONSE_OPERATIONS = [result.ok() for result in VMWARE_OPERATIONS if isinstance(result, Ok)]
+STRIPE_RESPONSE_OPERATIONS = [
+    result.ok() for result in itertools.islice(STRIPE_SCHEMA.get_all_operations(), 100) if isinstance(result, Ok)
+]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "operations", [VMWARE_RESPONSE_OPERATIONS, STRIPE_RESPONSE_OPERATIONS], ids=("vmware", "stripe")
+)
+def test_validate_response(operations):
+    for operation in operations:
+        with suppress(AssertionError):
+            operation.validate_response(JSON_RESPONSE)
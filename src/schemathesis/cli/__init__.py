@@ -25,6 +25,7 @@ from ..constants import (
     BASE_URL_ENV_VAR,
     DEFAULT_RESPONSE_TIMEOUT,
     DEFAULT_STATEFUL_RECURSION_LIMIT,
+    DEFAULT_UNIQUE_DATA_CACHE_SIZE,
     EXTENSIONS_DOCUMENTATION_URL,
     HOOKS_MODULE_ENV_VAR,
     HYPOTHESIS_IN_MEMORY_DATABASE_IDENTIFIER,
@@ -39,7 +40,7 @@ from ..hooks import GLOBAL_HOOK_DISPATCHER, HookContext, HookDispatcher, HookSco
 from ..internal.datetime import current_datetime
 from ..internal.output import OutputConfig
 from ..internal.validation import file_exists
-from ..loaders import load_app, load_yaml
+from ..loaders import load_app
 from ..runner import events, prepare_hypothesis_settings, probes
 from ..specs.graphql import loaders as gql_loaders
 from ..specs.openapi import loaders as oas_loaders
@@ -105,6 +106,7 @@ DEPRECATED_SHOW_ERROR_TRACEBACKS_OPTION_WARNING = (
     "Use `--show-trace` instead"
 )
 CASSETTES_PATH_INVALID_USAGE_MESSAGE = "Can't use `--store-network-log` and `--cassette-path` simultaneously"
+CASSETTE_INDEX_INVALID_FORMAT_MESSAGE = "`--cassette-index` is only supported for the VCR cassette format"
 COLOR_OPTIONS_INVALID_USAGE_MESSAGE = "Can't use `--no-color` and `--force-color` simultaneously"
 PHASES_INVALID_USAGE_MESSAGE = "Can't use `--hypothesis-phases` and `--hypothesis-no-phases` simultaneously"
 
@@ -289,6 +291,16 @@ REPORT_TO_SERVICE = ReportToService()
     callback=callbacks.convert_workers,
     metavar="",
 )
+@grouped_option(
+    "--workers-mode",
+    "workers_mode",
+    help="How concurrent workers run tests. `asyncio` shares one connection pool driven by an event loop, "
+    "`processes` spreads API operations among worker processes to use all CPU cores",
+    type=click.Choice(["threads", "asyncio", "processes"]),
+    default="threads",
+    show_default=True,
+    metavar="",
+)
 @grouped_option(
     "--dry-run",
     "dry_run",
@@ -533,6 +545,12 @@ REPORT_TO_SERVICE = ReportToService()
     is_flag=True,
     callback=callbacks.validate_preserve_exact_body_bytes,
 )
+@grouped_option(
+    "--cassette-index",
+    help="Write an index next to the cassette to speed up filtering in `st replay`",
+    is_flag=True,
+    callback=callbacks.validate_cassette_index,
+)
 @grouped_option(
     "--code-sample-style",
     help="Code sample style for reproducing failures",
@@ -652,6 +670,14 @@ REPORT_TO_SERVICE = ReportToService()
     default=False,
     show_default=True,
 )
+@grouped_option(
+    "--contrib-unique-data-cache-size",
+    "contrib_unique_data_cache_size",
+    help="Maximum number of test outcomes remembered to skip already tested cases with `--contrib-unique-data`",
+    type=click.IntRange(1),
+    default=DEFAULT_UNIQUE_DATA_CACHE_SIZE,
+    show_default=True,
+)
 @grouped_option(
     "--contrib-openapi-formats-uuid",
     "contrib_openapi_formats_uuid",
@@ -870,6 +896,7 @@ def run(
     tags: tuple[str, ...] = (),
     operation_ids: tuple[str, ...] = (),
     workers_num: int = DEFAULT_WORKERS,
+    workers_mode: Literal["threads", "asyncio", "processes"] = "threads",
     base_url: str | None = None,
     app: str | None = None,
     request_timeout: int | None = None,
@@ -887,6 +914,7 @@ def run(
     cassette_path: click.utils.LazyFile | None = None,
     cassette_format: cassettes.CassetteFormat = cassettes.CassetteFormat.VCR,
     cassette_preserve_exact_body_bytes: bool = False,
+    cassette_index: bool = False,
     store_network_log: click.utils.LazyFile | None = None,
     wait_for_schema: float | None = None,
     fixups: tuple[str] = (),  # type: ignore
@@ -897,6 +925,7 @@ def run(
     sanitize_output: bool = True,
     output_truncate: bool = True,
     contrib_unique_data: bool = False,
+    contrib_unique_data_cache_size: int = DEFAULT_UNIQUE_DATA_CACHE_SIZE,
     contrib_openapi_formats_uuid: bool = False,
     contrib_openapi_fill_missing_examples: bool = False,
     hypothesis_database: str | None = None,
@@ -980,6 +1009,8 @@ def run(
     if store_network_log is not None:
         click.secho(DEPRECATED_CASSETTE_PATH_OPTION_WARNING, fg="yellow")
         cassette_path = store_network_log
+    if cassette_index and cassette_format != cassettes.CassetteFormat.VCR:
+        raise click.UsageError(CASSETTE_INDEX_INVALID_FORMAT_MESSAGE)
 
     output_config = OutputConfig(truncate=output_truncate)
 
@@ -1186,12 +1217,14 @@ def run(
         exit_first=exit_first,
         max_failures=max_failures,
         unique_data=contrib_unique_data,
+        unique_data_cache_size=contrib_unique_data_cache_size,
         dry_run=dry_run,
         store_interactions=cassette_path is not None,
         checks=selected_checks,
         max_response_time=max_response_time,
         targets=selected_targets,
         workers_num=workers_num,
+        workers_mode=workers_mode,
         rate_limit=rate_limit,
         stateful=stateful,
         stateful_recursion_limit=stateful_recursion_limit,
@@ -1213,6 +1246,7 @@ def run(
         cassette_path=cassette_path,
         cassette_format=cassette_format,
         cassette_preserve_exact_body_bytes=cassette_preserve_exact_body_bytes,
+        cassette_index=cassette_index,
         junit_xml=junit_xml,
         verbosity=verbosity,
         code_sample_style=code_sample_style,
@@ -1303,6 +1337,7 @@ def into_event_stream(
     max_response_time: int | None,
     targets: Iterable[Target],
     workers_num: int,
+    workers_mode: Literal["threads", "asyncio", "processes"],
     hypothesis_settings: hypothesis.settings | None,
     generation_config: generation.GenerationConfig,
     output_config: OutputConfig,
@@ -1311,6 +1346,7 @@ def into_event_stream(
     max_failures: int | None,
     rate_limit: str | None,
     unique_data: bool,
+    unique_data_cache_size: int,
     dry_run: bool,
     store_interactions: bool,
     stateful: Stateful | None,
@@ -1355,12 +1391,14 @@ def into_event_stream(
             max_failures=max_failures,
             started_at=started_at,
             unique_data=unique_data,
+            unique_data_cache_size=unique_data_cache_size,
             dry_run=dry_run,
             store_interactions=store_interactions,
             checks=checks,
             max_response_time=max_response_time,
             targets=targets,
             workers_num=workers_num,
+            workers_mode=workers_mode,
             stateful=stateful,
             stateful_recursion_limit=stateful_recursion_limit,
             hypothesis_settings=hypothesis_settings,
@@ -1599,6 +1637,7 @@ def execute(
     cassette_path: click.utils.LazyFile | None,
     cassette_format: cassettes.CassetteFormat,
     cassette_preserve_exact_body_bytes: bool,
+    cassette_index: bool,
     junit_xml: click.utils.LazyFile | None,
     verbosity: int,
     code_sample_style: CodeSampleStyle,
@@ -1661,7 +1700,10 @@ def execute(
         _open_file(cassette_path)
         handlers.append(
             cassettes.CassetteWriter(
-                cassette_path, format=cassette_format, preserve_exact_body_bytes=cassette_preserve_exact_body_bytes
+                cassette_path,
+                format=cassette_format,
+                preserve_exact_body_bytes=cassette_preserve_exact_body_bytes,
+                index=cassette_index,
             )
         )
     for custom_handler in CUSTOM_HANDLERS:
@@ -1802,6 +1844,15 @@ def get_exit_code(event: events.ExecutionEvent) -> int:
 @click.option("--no-color", help="Disable ANSI color escape codes", type=bool, is_flag=True)
 @click.option("--force-color", help="Explicitly tells to enable ANSI color escape codes", type=bool, is_flag=True)
 @click.option("--verbosity", "-v", help="Increase verbosity of the output", count=True)
+@click.option(
+    "--workers",
+    "-w",
+    "workers_num",
+    help="Number of concurrent workers sending requests. The output order is preserved",
+    type=click.IntRange(MIN_WORKERS, MAX_WORKERS),
+    default=DEFAULT_WORKERS,
+    show_default=True,
+)
 @with_request_tls_verify
 @with_request_proxy
 @with_request_cert
@@ -1816,6 +1867,7 @@ def replay(
     method: str | None = None,
     no_color: bool = False,
     verbosity: int = 0,
+    workers_num: int = DEFAULT_WORKERS,
     request_tls_verify: bool = True,
     request_cert: str | None = None,
     request_cert_key: str | None = None,
@@ -1824,7 +1876,7 @@ def replay(
 ) -> None:
     """Replay a cassette.
 
-    Cassettes in VCR-compatible format can be replayed.
+    Cassettes in VCR-compatible, HAR and compact formats can be replayed.
     For example, ones that are recorded with the ``--cassette-path`` option of the `st run` command.
     """
     if no_color and force_color:
@@ -1832,37 +1884,86 @@ def replay(
     decide_color_output(ctx, no_color, force_color)
 
     click.secho(f"{bold('Replaying cassette')}: {cassette_path}")
+    index = cassettes.CassetteIndex.load(cassette_path)
     with open(cassette_path, "rb") as fd:
-        cassette = load_yaml(fd)
-    click.secho(f"{bold('Total interactions')}: {len(cassette['http_interactions'])}\n")
-    for replayed in cassettes.replay(
-        cassette,
-        id_=id_,
-        status=status,
-        uri=uri,
-        method=method,
-        request_tls_verify=request_tls_verify,
-        request_cert=prepare_request_cert(request_cert, request_cert_key),
-        request_proxy=request_proxy,
-    ):
-        click.secho(f"  {bold('ID')}              : {replayed.interaction['id']}")
-        click.secho(f"  {bold('URI')}             : {replayed.interaction['request']['uri']}")
-        click.secho(f"  {bold('Old status code')} : {replayed.interaction['response']['status']['code']}")
-        click.secho(f"  {bold('New status code')} : {replayed.response.status_code}")
-        if verbosity > 0:
-            data = replayed.interaction["response"]
-            old_body = ""
-            # Body may be missing for 204 responses
-            if "body" in data:
-                if "base64_string" in data["body"]:
-                    content = data["body"]["base64_string"]
-                    if content:
-                        old_body = base64.b64decode(content).decode(errors="replace")
-                else:
-                    old_body = data["body"]["string"]
-            click.secho(f"  {bold('Old payload')} : {old_body}")
-            click.secho(f"  {bold('New payload')} : {replayed.response.text}")
-        click.echo()
+        interactions: Iterable[dict[str, Any]]
+        if index is not None:
+            click.secho(f"{bold('Total interactions')}: {index.interactions_count}\n")
+            # Only matching interactions are read from the cassette
+            entries = cassettes.filter_index(index.iter_entries(), id_=id_, status=status, uri=uri, method=method)
+            interactions = cassettes.iter_indexed_interactions(fd, entries)
+        else:
+            click.secho(f"{bold('Total interactions')}: {cassettes.count_interactions(fd)}\n")
+            interactions = cassettes.iter_interactions(fd)
+        replayed_interactions = cassettes.replay(
+            interactions,
+            id_=id_,
+            status=status,
+            uri=uri,
+            method=method,
+            request_tls_verify=request_tls_verify,
+            request_cert=prepare_request_cert(request_cert, request_cert_key),
+            request_proxy=request_proxy,
+            workers_num=workers_num,
+        )
+        for replayed in replayed_interactions:
+            _display_replayed(replayed, verbosity)
+
+
+def _display_replayed(replayed: cassettes.Replayed, verbosity: int) -> None:
+    click.secho(f"  {bold('ID')}              : {replayed.interaction['id']}")
+    click.secho(f"  {bold('URI')}             : {replayed.interaction['request']['uri']}")
+    click.secho(f"  {bold('Old status code')} : {replayed.interaction['response']['status']['code']}")
+    click.secho(f"  {bold('New status code')} : {replayed.response.status_code}")
+    if verbosity > 0:
+        data = replayed.interaction["response"]
+        old_body = ""
+        # Body may be missing for 204 responses
+        if "body" in data:
+            if "base64_string" in data["body"]:
+                content = data["body"]["base64_string"]
+                if content:
+                    old_body = base64.b64decode(content).decode(errors="replace")
+            else:
+                old_body = data["body"]["string"]
+        click.secho(f"  {bold('Old payload')} : {old_body}")
+        click.secho(f"  {bold('New payload')} : {replayed.response.text}")
+    click.echo()
+
+
+CONVERT_CASSETTE_INVALID_INPUT_MESSAGE = "Only cassettes in the compact format can be converted"
+
+
+@schemathesis.command(short_help="Convert a compact cassette to VCR or HAR.")
+@click.argument("cassette_path", type=click.Path(exists=True))
+@click.argument("output", type=click.File("w", encoding="utf-8"))
+@click.option(
+    "--format",
+    "format_",
+    help="Format of the resulting cassette",
+    type=click.Choice([cassettes.CassetteFormat.VCR.value, cassettes.CassetteFormat.HAR.value]),
+    default=cassettes.CassetteFormat.VCR.value,
+    callback=callbacks.convert_cassette_format,
+    show_default=True,
+)
+@click.option(
+    "--preserve-exact-body-bytes",
+    help="Retain exact byte sequence of payloads, encoded as base64",
+    is_flag=True,
+)
+def convert_cassette(
+    cassette_path: str,
+    output: click.utils.LazyFile,
+    format_: cassettes.CassetteFormat,
+    preserve_exact_body_bytes: bool = False,
+) -> None:
+    """Convert a cassette recorded with `--cassette-format=compact` to a VCR-compatible or HAR cassette."""
+    with open(cassette_path, "rb") as fd:
+        if cassettes.detect_cassette_format(fd) != cassettes.CassetteFormat.COMPACT:
+            raise click.UsageError(CONVERT_CASSETTE_INVALID_INPUT_MESSAGE)
+        cassettes.convert_compact_cassette(
+            fd, output, format=format_, preserve_exact_body_bytes=preserve_exact_body_bytes
+        )
 
 
 @schemathesis.command(short_help="Upload report to Schemathesis.io.")
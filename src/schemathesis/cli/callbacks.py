@@ -39,6 +39,9 @@ INVALID_DERANDOMIZE_MESSAGE = (
 MISSING_CASSETTE_PATH_ARGUMENT_MESSAGE = (
     "Missing argument, `--cassette-path` should be specified as well if you use `--cassette-preserve-exact-body-bytes`."
 )
+MISSING_CASSETTE_PATH_FOR_INDEX_MESSAGE = (
+    "Missing argument, `--cassette-path` should be specified as well if you use `--cassette-index`."
+)
 INVALID_SCHEMA_MESSAGE = "Invalid SCHEMA, must be a valid URL, file path or an API name from Schemathesis.io."
 FILE_DOES_NOT_EXIST_MESSAGE = "The specified file does not exist. Please provide a valid path to an existing file."
 INVALID_BASE_URL_MESSAGE = (
@@ -314,6 +317,12 @@ def validate_preserve_exact_body_bytes(ctx: click.core.Context, param: click.cor
     return raw_value
 
 
+def validate_cassette_index(ctx: click.core.Context, param: click.core.Parameter, raw_value: bool) -> bool:
+    if raw_value and ctx.params["cassette_path"] is None:
+        raise click.UsageError(MISSING_CASSETTE_PATH_FOR_INDEX_MESSAGE)
+    return raw_value
+
+
 def convert_verbosity(
     ctx: click.core.Context, param: click.core.Parameter, value: str | None
 ) -> hypothesis.Verbosity | None:
@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import base64
 import enum
+import io
 import json
+import os
 import re
+import struct
 import sys
 import threading
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from http.cookies import SimpleCookie
 from queue import Queue
-from typing import IO, TYPE_CHECKING, Any, Callable, Generator, Iterator, cast
+from typing import IO, TYPE_CHECKING, Any, Callable, Generator, Iterable, Iterator, cast
 from urllib.parse import parse_qsl, urlparse
 
 import harfile
@@ -22,7 +28,7 @@ if TYPE_CHECKING:
     import click
     import requests
 
-    from ..models import Request, Response
+    from ..models import Request, Response, Status
     from ..runner.serialization import SerializedCheck, SerializedInteraction
     from ..types import RequestCert
     from .context import ExecutionContext
@@ -36,6 +42,7 @@ class CassetteFormat(str, enum.Enum):
 
     VCR = "vcr"
     HAR = "har"
+    COMPACT = "compact"
 
     @classmethod
     def from_str(cls, value: str) -> CassetteFormat:
@@ -59,6 +66,8 @@ class CassetteWriter(EventHandler):
     file_handle: click.utils.LazyFile
     format: CassetteFormat
     preserve_exact_body_bytes: bool
+    # Write a sidecar index for faster filtering. Only VCR cassettes are supported
+    index: bool = False
     queue: Queue = field(default_factory=Queue)
     worker: threading.Thread = field(init=False)
 
@@ -71,8 +80,11 @@ class CassetteWriter(EventHandler):
         writer: Callable
         if self.format == CassetteFormat.HAR:
             writer = har_writer
+        elif self.format == CassetteFormat.COMPACT:
+            writer = compact_writer
         else:
             writer = vcr_writer
+            kwargs["index"] = self.index
         self.worker = threading.Thread(name="SchemathesisCassetteWriter", target=writer, kwargs=kwargs)
         self.worker.start()
 
@@ -86,6 +98,7 @@ class CassetteWriter(EventHandler):
                     correlation_id=event.correlation_id,
                     thread_id=event.thread_id,
                     interactions=event.result.interactions,
+                    operation=event.result.verbose_name,
                 )
             )
         elif isinstance(event, events.AfterStatefulExecution):
@@ -95,6 +108,7 @@ class CassetteWriter(EventHandler):
                     correlation_id="",
                     thread_id=event.thread_id,
                     interactions=event.result.interactions,
+                    operation=event.result.verbose_name,
                 )
             )
         elif isinstance(event, events.Finished):
@@ -113,6 +127,8 @@ class Initialize:
     """Start up, the first message to make preparations before proceeding the input data."""
 
     seed: int | None
+    # How Schemathesis was run, if it differs from the current process, e.g. when converting cassettes
+    command: str | None = None
 
 
 @dataclass
@@ -122,6 +138,7 @@ class Process:
     correlation_id: str
     thread_id: int
     interactions: list[SerializedInteraction]
+    operation: str = ""
 
 
 @dataclass
@@ -138,7 +155,9 @@ def get_command_representation() -> str:
     return f"st {args}"
 
 
-def vcr_writer(file_handle: click.utils.LazyFile, preserve_exact_body_bytes: bool, queue: Queue) -> None:
+def vcr_writer(
+    file_handle: click.utils.LazyFile, preserve_exact_body_bytes: bool, queue: Queue, index: bool = False
+) -> None:
     """Write YAML to a file in an incremental manner.
 
     This implementation doesn't use `pyyaml` package and composes YAML manually as string due to the following reasons:
@@ -150,6 +169,7 @@ def vcr_writer(file_handle: click.utils.LazyFile, preserve_exact_body_bytes: boo
     """
     current_id = 1
     stream = file_handle.open()
+    index_entries: list[IndexEntry] | None = [] if index else None
 
     def format_header_values(values: list[str]) -> str:
         return "\n".join(f"      - {json.dumps(v)}" for v in values)
@@ -193,8 +213,9 @@ def vcr_writer(file_handle: click.utils.LazyFile, preserve_exact_body_bytes: boo
     else:
 
         def format_request_body(output: IO, request: Request) -> None:
-            if request.body is not None:
-                string = _safe_decode(request.body, "utf8")
+            body = request.deserialize_body()
+            if body is not None:
+                string = body.decode("utf8", "replace")
                 output.write(
                     """
     body:
@@ -204,9 +225,10 @@ def vcr_writer(file_handle: click.utils.LazyFile, preserve_exact_body_bytes: boo
                 write_double_quoted(output, string)
 
         def format_response_body(output: IO, response: Response) -> None:
-            if response.body is not None:
+            body = response.deserialize_body()
+            if body is not None:
                 encoding = response.encoding or "utf8"
-                string = _safe_decode(response.body, encoding)
+                string = body.decode(encoding, "replace")
                 output.write(
                     f"""    body:
       encoding: '{encoding}'
@@ -219,14 +241,31 @@ def vcr_writer(file_handle: click.utils.LazyFile, preserve_exact_body_bytes: boo
         item = queue.get()
         if isinstance(item, Initialize):
             seed = f"'{item.seed}'"
+            command = item.command if item.command is not None else get_command_representation()
             stream.write(
-                f"""command: '{get_command_representation()}'
+                f"""command: '{command}'
 recorded_with: 'Schemathesis {SCHEMATHESIS_VERSION}'
 http_interactions:"""
             )
         elif isinstance(item, Process):
             for interaction in item.interactions:
                 status = interaction.status.name.upper()
+                if index_entries is not None:
+                    # Getting the position flushes the buffer, therefore it is done only if the index is requested
+                    position = stream.tell()
+                    if index_entries:
+                        index_entries[-1].length = position - index_entries[-1].offset
+                    index_entries.append(
+                        IndexEntry(
+                            offset=position,
+                            length=0,
+                            id=str(current_id),
+                            status=status,
+                            method=interaction.request.method,
+                            uri=interaction.request.uri,
+                            operation=item.operation,
+                        )
+                    )
                 # Body payloads are handled via separate `stream.write` calls to avoid some allocations
                 phase = f"'{interaction.phase.value}'" if interaction.phase is not None else "null"
                 stream.write(
@@ -280,14 +319,14 @@ http_interactions:"""
                 current_id += 1
         else:
             break
+    if index_entries is not None:
+        cassette_size = stream.tell()
+        if index_entries:
+            index_entries[-1].length = cassette_size - index_entries[-1].offset
+        write_index(get_index_path(file_handle.name), index_entries, cassette_size)
     file_handle.close()
 
 
-def _safe_decode(value: str, encoding: str) -> str:
-    """Decode base64-encoded body bytes as a string."""
-    return base64.b64decode(value).decode(encoding, "replace")
-
-
 def write_double_quoted(stream: IO, text: str) -> None:
     """Writes a valid YAML string enclosed in double quotes."""
     from yaml.emitter import Emitter
@@ -330,12 +369,15 @@ def write_double_quoted(stream: IO, text: str) -> None:
 def har_writer(file_handle: click.utils.LazyFile, preserve_exact_body_bytes: bool, queue: Queue) -> None:
     if preserve_exact_body_bytes:
 
-        def get_body(body: str) -> str:
-            return body
+        def get_body(message: Request | Response) -> str | None:
+            return message.body
     else:
 
-        def get_body(body: str) -> str:
-            return base64.b64decode(body).decode("utf-8", errors="replace")
+        def get_body(message: Request | Response) -> str | None:
+            body = message.deserialize_body()
+            if body is None:
+                return None
+            return body.decode("utf-8", errors="replace")
 
     with harfile.open(file_handle) as har:
         while True:
@@ -343,22 +385,22 @@ def har_writer(file_handle: click.utils.LazyFile, preserve_exact_body_bytes: boo
             if isinstance(item, Process):
                 for interaction in item.interactions:
                     query_params = urlparse(interaction.request.uri).query
-                    if interaction.request.body is not None:
+                    request_body = get_body(interaction.request)
+                    if request_body is not None:
                         post_data = harfile.PostData(
                             mimeType=interaction.request.headers.get("Content-Type", [""])[0],
-                            text=get_body(interaction.request.body),
+                            text=request_body,
                         )
                     else:
                         post_data = None
                     if interaction.response is not None:
                         content_type = interaction.response.headers.get("Content-Type", [""])[0]
+                        response_body = get_body(interaction.response)
                         content = harfile.Content(
                             size=interaction.response.body_size or 0,
                             mimeType=content_type,
-                            text=get_body(interaction.response.body) if interaction.response.body is not None else None,
-                            encoding="base64"
-                            if interaction.response.body is not None and preserve_exact_body_bytes
-                            else None,
+                            text=response_body,
+                            encoding="base64" if response_body is not None and preserve_exact_body_bytes else None,
                         )
                         http_version = f"HTTP/{interaction.response.http_version}"
                         response = harfile.Response(
@@ -444,6 +486,687 @@ def _cookie_to_har(cookie: str) -> Iterator[harfile.Cookie]:
         )
 
 
+# Compact cassettes consist of a header and a sequence of compressed blocks. Each block contains length-prefixed
+# records, one per interaction. Bodies are stored as raw bytes, without base64 or escaping
+COMPACT_MAGIC = b"STCASSETTE"
+COMPACT_VERSION = 1
+# Uncompressed size after which the current block is written to disk
+COMPACT_BLOCK_SIZE = 1024 * 1024
+COMPACT_UINT32 = struct.Struct("<I")
+# Compressed size & number of records
+COMPACT_BLOCK_HEADER = struct.Struct("<II")
+# Length prefix for absent bodies
+COMPACT_NO_BODY = 0xFFFFFFFF
+ZSTD_NOT_INSTALLED_MESSAGE = (
+    "The cassette is compressed with Zstandard. Install the `zstandard` package to read it: `pip install zstandard`"
+)
+GZIP_WBITS = 31
+
+
+class Compression(str, enum.Enum):
+    """Block compression used in compact cassettes."""
+
+    ZSTD = "zstd"
+    GZIP = "gzip"
+
+    @classmethod
+    def default(cls) -> Compression:
+        # Zstandard is faster & compresses better, but it is an optional dependency
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            return cls.GZIP
+        return cls.ZSTD
+
+    def get_compressor(self) -> Callable[[bytes], bytes]:
+        if self == Compression.ZSTD:
+            import zstandard
+
+            return zstandard.ZstdCompressor().compress
+
+        def compress(data: bytes) -> bytes:
+            compressor = zlib.compressobj(6, zlib.DEFLATED, GZIP_WBITS)
+            return compressor.compress(data) + compressor.flush()
+
+        return compress
+
+    def get_decompressor(self) -> Callable[[bytes], bytes]:
+        if self == Compression.ZSTD:
+            try:
+                import zstandard
+            except ImportError:
+                import click
+
+                raise click.UsageError(ZSTD_NOT_INSTALLED_MESSAGE) from None
+
+            return zstandard.ZstdDecompressor().decompress
+
+        def decompress(data: bytes) -> bytes:
+            return zlib.decompress(data, GZIP_WBITS)
+
+        return decompress
+
+
+def compact_writer(file_handle: click.utils.LazyFile, preserve_exact_body_bytes: bool, queue: Queue) -> None:
+    """Write interactions as length-prefixed binary records compressed in blocks.
+
+    Bodies are always stored exactly, therefore `preserve_exact_body_bytes` has no effect.
+    """
+    # The output file is opened in text mode, as for other formats
+    stream = file_handle.open().buffer
+    compression = Compression.default()
+    compress = compression.get_compressor()
+    block = bytearray()
+    records = 0
+
+    def write_block() -> None:
+        nonlocal records
+        if records:
+            data = compress(bytes(block))
+            stream.write(COMPACT_BLOCK_HEADER.pack(len(data), records))
+            stream.write(data)
+            block.clear()
+            records = 0
+
+    while True:
+        item = queue.get()
+        if isinstance(item, Initialize):
+            header = json.dumps(
+                {
+                    "command": item.command if item.command is not None else get_command_representation(),
+                    "recorded_with": f"Schemathesis {SCHEMATHESIS_VERSION}",
+                    "seed": item.seed,
+                    "compression": compression.value,
+                }
+            ).encode("utf-8")
+            stream.write(COMPACT_MAGIC)
+            stream.write(bytes((COMPACT_VERSION,)))
+            stream.write(COMPACT_UINT32.pack(len(header)))
+            stream.write(header)
+        elif isinstance(item, Process):
+            for interaction in item.interactions:
+                _write_compact_record(block, item, interaction)
+                records += 1
+            if len(block) >= COMPACT_BLOCK_SIZE:
+                write_block()
+        else:
+            break
+    write_block()
+    file_handle.close()
+
+
+def _write_compact_record(block: bytearray, item: Process, interaction: SerializedInteraction) -> None:
+    request = interaction.request
+    response = interaction.response
+    meta = {
+        "status": interaction.status.value,
+        "thread_id": item.thread_id,
+        "correlation_id": item.correlation_id,
+        "operation": item.operation,
+        "data_generation_method": interaction.data_generation_method.value,
+        "phase": interaction.phase.value if interaction.phase is not None else None,
+        "description": interaction.description,
+        "recorded_at": interaction.recorded_at,
+        "checks": [(check.name, check.value.value, check.message) for check in interaction.checks],
+        "request": {
+            "method": request.method,
+            "uri": request.uri,
+            "headers": request.headers,
+            "body_size": request.body_size,
+        },
+        "response": {
+            "status_code": response.status_code,
+            "message": response.message,
+            "headers": response.headers,
+            "body_size": response.body_size,
+            "encoding": response.encoding,
+            "http_version": response.http_version,
+            "elapsed": response.elapsed,
+            "verify": response.verify,
+        }
+        if response is not None
+        else None,
+    }
+    data = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+    block += COMPACT_UINT32.pack(len(data))
+    block += data
+    for body in (request.deserialize_body(), response.deserialize_body() if response is not None else None):
+        if body is None:
+            block += COMPACT_UINT32.pack(COMPACT_NO_BODY)
+        else:
+            block += COMPACT_UINT32.pack(len(body))
+            block += body
+
+
+@dataclass
+class CompactHeader:
+    command: str
+    recorded_with: str
+    seed: int | None
+    compression: Compression
+
+    __slots__ = ("command", "recorded_with", "seed", "compression")
+
+
+@dataclass
+class CompactRecord:
+    """A single interaction stored in a compact cassette."""
+
+    meta: dict[str, Any]
+    request_body: bytes | None
+    response_body: bytes | None
+
+    __slots__ = ("meta", "request_body", "response_body")
+
+
+def read_compact_header(fd: IO[bytes]) -> CompactHeader:
+    prefix = fd.read(len(COMPACT_MAGIC) + 1)
+    if prefix[:-1] != COMPACT_MAGIC:
+        raise ValueError("Not a compact cassette")
+    if prefix[-1] != COMPACT_VERSION:
+        raise ValueError(f"Unsupported compact cassette version: {prefix[-1]}")
+    (length,) = COMPACT_UINT32.unpack(fd.read(COMPACT_UINT32.size))
+    data = json.loads(fd.read(length))
+    return CompactHeader(
+        command=data["command"],
+        recorded_with=data["recorded_with"],
+        seed=data["seed"],
+        compression=Compression(data["compression"]),
+    )
+
+
+def _iter_compact_blocks(fd: IO[bytes]) -> Iterator[tuple[int, int]]:
+    """Iterate over compressed sizes and record counts of blocks, leaving the file positioned at the block payload."""
+    while True:
+        header = fd.read(COMPACT_BLOCK_HEADER.size)
+        if len(header) < COMPACT_BLOCK_HEADER.size:
+            return
+        yield COMPACT_BLOCK_HEADER.unpack(header)
+
+
+def iter_compact_records(fd: IO[bytes], header: CompactHeader) -> Iterator[CompactRecord]:
+    """Decompress one block at a time and decode its records.
+
+    The file should be positioned right after the header.
+    """
+    decompress = header.compression.get_decompressor()
+    for size, _ in _iter_compact_blocks(fd):
+        block = memoryview(decompress(fd.read(size)))
+        position = 0
+        while position < len(block):
+            (length,) = COMPACT_UINT32.unpack_from(block, position)
+            position += COMPACT_UINT32.size
+            meta = json.loads(bytes(block[position : position + length]))
+            position += length
+            bodies = []
+            for _ in range(2):
+                (length,) = COMPACT_UINT32.unpack_from(block, position)
+                position += COMPACT_UINT32.size
+                if length == COMPACT_NO_BODY:
+                    bodies.append(None)
+                else:
+                    bodies.append(bytes(block[position : position + length]))
+                    position += length
+            yield CompactRecord(meta=meta, request_body=bodies[0], response_body=bodies[1])
+
+
+def _count_compact_interactions(fd: IO[bytes]) -> int:
+    # Only block headers are read, payloads are skipped
+    read_compact_header(fd)
+    count = 0
+    for size, records in _iter_compact_blocks(fd):
+        count += records
+        fd.seek(size, io.SEEK_CUR)
+    return count
+
+
+def iter_compact_interactions(fd: IO[bytes]) -> Iterator[dict[str, Any]]:
+    """Read a compact cassette as interactions in the same structure as in VCR cassettes."""
+    header = read_compact_header(fd)
+    seed = str(header.seed) if header.seed is not None else None
+    for idx, record in enumerate(iter_compact_records(fd, header), 1):
+        meta = record.meta
+        request = meta["request"]
+        serialized_request: dict[str, Any] = {
+            "uri": request["uri"],
+            "method": request["method"],
+            "headers": request["headers"],
+        }
+        if record.request_body is not None:
+            serialized_request["body"] = {
+                "encoding": "utf-8",
+                "base64_string": base64.b64encode(record.request_body).decode(),
+            }
+        response = meta["response"]
+        serialized_response: dict[str, Any] | None = None
+        if response is not None:
+            serialized_response = {
+                "status": {"code": str(response["status_code"]), "message": response["message"]},
+                "headers": response["headers"],
+                "http_version": response["http_version"],
+            }
+            if record.response_body is not None:
+                serialized_response["body"] = {
+                    "encoding": response["encoding"],
+                    "base64_string": base64.b64encode(record.response_body).decode(),
+                }
+        yield {
+            "id": str(idx),
+            "status": meta["status"].upper(),
+            "seed": seed,
+            "thread_id": meta["thread_id"],
+            "correlation_id": meta["correlation_id"],
+            "data_generation_method": meta["data_generation_method"],
+            "meta": {"description": meta["description"]},
+            "phase": meta["phase"],
+            "elapsed": str(response["elapsed"] if response is not None else 0),
+            "recorded_at": meta["recorded_at"],
+            "checks": [
+                {"name": name, "status": value.upper(), "message": message} for name, value, message in meta["checks"]
+            ],
+            "request": serialized_request,
+            "response": serialized_response,
+        }
+
+
+@dataclass
+class _StoredCheck:
+    """Check attributes kept in compact cassettes. It is enough for other cassette writers."""
+
+    name: str
+    value: Status
+    message: str | None
+
+    __slots__ = ("name", "value", "message")
+
+
+def _record_to_interaction(record: CompactRecord) -> SerializedInteraction:
+    from ..generation import DataGenerationMethod
+    from ..models import Request, Response, Status, TestPhase
+    from ..runner.serialization import SerializedInteraction
+
+    meta = record.meta
+    request = meta["request"]
+    response = meta["response"]
+    checks = [_StoredCheck(name=name, value=Status(value), message=message) for name, value, message in meta["checks"]]
+    return SerializedInteraction(
+        request=Request(
+            method=request["method"],
+            uri=request["uri"],
+            body=record.request_body,  # type: ignore[arg-type]
+            body_size=request["body_size"],
+            headers=request["headers"],
+        ),
+        response=Response(
+            status_code=response["status_code"],
+            message=response["message"],
+            headers=response["headers"],
+            body=record.response_body,  # type: ignore[arg-type]
+            body_size=response["body_size"],
+            encoding=response["encoding"],
+            http_version=response["http_version"],
+            elapsed=response["elapsed"],
+            verify=response["verify"],
+        )
+        if response is not None
+        else None,
+        checks=cast("list[SerializedCheck]", checks),
+        status=Status(meta["status"]),
+        data_generation_method=DataGenerationMethod(meta["data_generation_method"]),
+        phase=TestPhase(meta["phase"]) if meta["phase"] is not None else None,
+        description=meta["description"],
+        recorded_at=meta["recorded_at"],
+    )
+
+
+# Number of converted records waiting for the writer
+CONVERT_QUEUE_SIZE = 64
+
+
+def convert_compact_cassette(
+    fd: IO[bytes],
+    file_handle: click.utils.LazyFile,
+    format: CassetteFormat,
+    preserve_exact_body_bytes: bool = False,
+) -> None:
+    """Convert a compact cassette to VCR or HAR by replaying its records through the corresponding writer."""
+    header = read_compact_header(fd)
+    writer = {CassetteFormat.VCR: vcr_writer, CassetteFormat.HAR: har_writer}[format]
+    # Bounded, so only a few records are kept in memory
+    queue: Queue = Queue(maxsize=CONVERT_QUEUE_SIZE)
+    worker = threading.Thread(
+        name="SchemathesisCassetteConverter",
+        target=writer,
+        kwargs={"file_handle": file_handle, "queue": queue, "preserve_exact_body_bytes": preserve_exact_body_bytes},
+    )
+    worker.start()
+    try:
+        queue.put(Initialize(seed=header.seed, command=header.command))
+        for record in iter_compact_records(fd, header):
+            queue.put(
+                Process(
+                    correlation_id=record.meta["correlation_id"],
+                    thread_id=record.meta["thread_id"],
+                    interactions=[_record_to_interaction(record)],
+                    operation=record.meta["operation"],
+                )
+            )
+    finally:
+        queue.put(Finalize())
+        worker.join()
+
+
+# Size of chunks read from HAR files
+HAR_READ_CHUNK_SIZE = 64 * 1024
+HAR_ENTRIES_RE = re.compile(r'"entries"\s*:\s*\[')
+# Every worker may have this many interactions waiting to be sent
+REPLAY_QUEUE_SIZE_PER_WORKER = 2
+
+
+def detect_cassette_format(fd: IO[bytes]) -> CassetteFormat:
+    """Detect the cassette format by its magic bytes or the first non-whitespace byte."""
+    position = fd.tell()
+    try:
+        if fd.read(len(COMPACT_MAGIC)) == COMPACT_MAGIC:
+            return CassetteFormat.COMPACT
+        fd.seek(position)
+        while True:
+            byte = fd.read(1)
+            if not byte or not byte.isspace():
+                break
+    finally:
+        fd.seek(position)
+    return CassetteFormat.HAR if byte == b"{" else CassetteFormat.VCR
+
+
+def iter_interactions(fd: IO[bytes]) -> Iterator[dict[str, Any]]:
+    """Lazily read interactions from a cassette.
+
+    Only one interaction is kept in memory at a time, regardless of the cassette size.
+    """
+    format = detect_cassette_format(fd)
+    if format == CassetteFormat.COMPACT:
+        yield from iter_compact_interactions(fd)
+    elif format == CassetteFormat.HAR:
+        for idx, entry in enumerate(iter_har_entries(fd), 1):
+            yield har_entry_to_interaction(entry, idx)
+    else:
+        for _, block in iter_vcr_blocks(fd):
+            yield load_vcr_interaction(block)
+
+
+def count_interactions(fd: IO[bytes]) -> int:
+    """Count interactions in a cassette without keeping them in memory."""
+    position = fd.tell()
+    try:
+        format = detect_cassette_format(fd)
+        if format == CassetteFormat.COMPACT:
+            return _count_compact_interactions(fd)
+        if format == CassetteFormat.HAR:
+            return sum(1 for _ in iter_har_entries(fd))
+        return _count_vcr_interactions(fd)
+    finally:
+        fd.seek(position)
+
+
+def _count_vcr_interactions(fd: IO[bytes]) -> int:
+    # Cheaper than `iter_vcr_blocks` as lines are not collected
+    count = 0
+    in_interactions = False
+    for line in fd:
+        if in_interactions:
+            if line.startswith(b"- "):
+                count += 1
+        elif line.startswith(b"http_interactions:"):
+            in_interactions = True
+    return count
+
+
+def iter_vcr_blocks(fd: IO[bytes]) -> Iterator[tuple[int, bytes]]:
+    """Split the `http_interactions` list of a VCR cassette into separate YAML documents.
+
+    Yields the offset of each interaction in the file together with its raw content. Every list item starts with `- `
+    at the beginning of a line, while its content is always indented.
+    """
+    in_interactions = False
+    offset = fd.tell()
+    start = offset
+    block: list[bytes] = []
+    for line in fd:
+        if in_interactions:
+            if line.startswith(b"- "):
+                if block:
+                    yield start, b"".join(block)
+                start = offset
+                block = [line]
+            elif block:
+                block.append(line)
+        elif line.startswith(b"http_interactions:"):
+            in_interactions = True
+        offset += len(line)
+    if block:
+        yield start, b"".join(block)
+
+
+def load_vcr_interaction(block: bytes) -> dict[str, Any]:
+    from ..loaders import load_yaml
+
+    return load_yaml(block)[0]
+
+
+# Sidecar index files are stored next to cassettes with this suffix
+CASSETTE_INDEX_SUFFIX = ".idx"
+CASSETTE_INDEX_MAGIC = "schemathesis-cassette-index"
+CASSETTE_INDEX_VERSION = "1"
+INDEX_FIELD_SEPARATOR = "\t"
+
+
+@dataclass
+class IndexEntry:
+    """Location of a single interaction inside a VCR cassette together with attributes used for filtering."""
+
+    offset: int
+    length: int
+    id: str
+    status: str
+    method: str
+    uri: str
+    operation: str
+
+    __slots__ = ("offset", "length", "id", "status", "method", "uri", "operation")
+
+    def serialize(self) -> str:
+        # URI is the last field, so it may contain the separator
+        return INDEX_FIELD_SEPARATOR.join(
+            (
+                str(self.offset),
+                str(self.length),
+                self.id,
+                self.status,
+                self.method,
+                _sanitize_index_field(self.operation),
+                _sanitize_index_field(self.uri, keep_separator=True),
+            )
+        )
+
+    @classmethod
+    def deserialize(cls, line: str) -> IndexEntry:
+        offset, length, id_, status, method, operation, uri = line.rstrip("\n").split(INDEX_FIELD_SEPARATOR, 6)
+        return cls(
+            offset=int(offset),
+            length=int(length),
+            id=id_,
+            status=status,
+            method=method,
+            uri=uri,
+            operation=operation,
+        )
+
+
+def _sanitize_index_field(value: str, keep_separator: bool = False) -> str:
+    value = value.replace("\r", " ").replace("\n", " ")
+    if not keep_separator:
+        value = value.replace(INDEX_FIELD_SEPARATOR, " ")
+    return value
+
+
+def get_index_path(cassette_path: str) -> str:
+    return f"{cassette_path}{CASSETTE_INDEX_SUFFIX}"
+
+
+def write_index(path: str, entries: list[IndexEntry], cassette_size: int) -> None:
+    """Write a sidecar index for a cassette.
+
+    The header contains the cassette size, so an index is ignored if the cassette was modified afterwards.
+    """
+    with open(path, "w", encoding="utf-8", newline="\n") as fd:
+        fd.write(
+            INDEX_FIELD_SEPARATOR.join(
+                (CASSETTE_INDEX_MAGIC, CASSETTE_INDEX_VERSION, str(cassette_size), str(len(entries)))
+            )
+        )
+        fd.write("\n")
+        for entry in entries:
+            fd.write(entry.serialize())
+            fd.write("\n")
+
+
+@dataclass
+class CassetteIndex:
+    """Sidecar index of a VCR cassette."""
+
+    path: str
+    interactions_count: int
+
+    __slots__ = ("path", "interactions_count")
+
+    @classmethod
+    def load(cls, cassette_path: str) -> CassetteIndex | None:
+        """Load the index for a cassette if it exists and matches the cassette."""
+        path = get_index_path(cassette_path)
+        try:
+            with open(path, encoding="utf-8") as fd:
+                header = fd.readline().rstrip("\n").split(INDEX_FIELD_SEPARATOR)
+            cassette_size = os.path.getsize(cassette_path)
+        except (OSError, UnicodeDecodeError):
+            return None
+        if (
+            len(header) != 4
+            or header[:2] != [CASSETTE_INDEX_MAGIC, CASSETTE_INDEX_VERSION]
+            or header[2] != str(cassette_size)
+            or not header[3].isdigit()
+        ):
+            return None
+        return cls(path=path, interactions_count=int(header[3]))
+
+    def iter_entries(self) -> Iterator[IndexEntry]:
+        with open(self.path, encoding="utf-8") as fd:
+            # Skip the header
+            fd.readline()
+            for line in fd:
+                yield IndexEntry.deserialize(line)
+
+
+def filter_index(
+    entries: Iterable[IndexEntry],
+    id_: str | None = None,
+    status: str | None = None,
+    uri: str | None = None,
+    method: str | None = None,
+) -> Iterator[IndexEntry]:
+    """Select index entries with the same semantics as `filter_cassette`."""
+    status_ = status.upper() if status is not None else None
+    uri_pattern = re.compile(uri) if uri is not None else None
+    method_pattern = re.compile(method) if method is not None else None
+    for entry in entries:
+        if id_ is not None and entry.id != id_:
+            continue
+        if status_ is not None and entry.status != status_:
+            continue
+        if uri_pattern is not None and not uri_pattern.search(entry.uri):
+            continue
+        if method_pattern is not None and not method_pattern.search(entry.method):
+            continue
+        yield entry
+        if id_ is not None:
+            # IDs are unique
+            break
+
+
+def iter_indexed_interactions(fd: IO[bytes], entries: Iterable[IndexEntry]) -> Iterator[dict[str, Any]]:
+    """Read only interactions pointed by the given index entries."""
+    for entry in entries:
+        fd.seek(entry.offset)
+        yield load_vcr_interaction(fd.read(entry.length))
+
+
+def iter_har_entries(fd: IO[bytes]) -> Iterator[dict[str, Any]]:
+    """Incrementally decode items of the `log.entries` array in a HAR file."""
+    decoder = json.JSONDecoder()
+    reader = io.TextIOWrapper(fd, encoding="utf-8", newline="")  # type: ignore[arg-type]
+    try:
+        buffer = ""
+        position = -1
+        # Find the beginning of the entries array
+        while position == -1:
+            chunk = reader.read(HAR_READ_CHUNK_SIZE)
+            if not chunk:
+                return
+            buffer += chunk
+            match = HAR_ENTRIES_RE.search(buffer)
+            if match is not None:
+                position = match.end()
+            else:
+                # Keep the tail, as the key could be split between chunks
+                buffer = buffer[-32:]
+        buffer = buffer[position:]
+        while True:
+            buffer = buffer.lstrip(" \t\r\n,")
+            if buffer.startswith("]"):
+                return
+            try:
+                entry, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                # The entry is incomplete
+                chunk = reader.read(HAR_READ_CHUNK_SIZE)
+                if not chunk:
+                    raise
+                buffer += chunk
+                continue
+            yield entry
+            buffer = buffer[end:]
+    finally:
+        # Do not close the underlying file
+        reader.detach()
+
+
+def har_entry_to_interaction(entry: dict[str, Any], idx: int) -> dict[str, Any]:
+    """Convert a HAR entry to the same structure as interactions in VCR cassettes."""
+    request = entry["request"]
+    headers: dict[str, list[str]] = {}
+    for header in request.get("headers", []):
+        headers.setdefault(header["name"], []).append(header["value"])
+    serialized_request: dict[str, Any] = {"uri": request["url"], "method": request["method"], "headers": headers}
+    post_data = request.get("postData")
+    if post_data is not None and post_data.get("text") is not None:
+        serialized_request["body"] = {"string": post_data["text"]}
+    response = entry.get("response") or {}
+    content = response.get("content") or {}
+    serialized_response: dict[str, Any] = {"status": {"code": str(response.get("status", 0))}}
+    if content.get("text") is not None:
+        if content.get("encoding") == "base64":
+            serialized_response["body"] = {"base64_string": content["text"]}
+        else:
+            serialized_response["body"] = {"string": content["text"]}
+    return {
+        "id": str(idx),
+        # HAR has no information about the test outcome
+        "status": None,
+        "request": serialized_request,
+        "response": serialized_response,
+    }
+
+
 @dataclass
 class Replayed:
     interaction: dict[str, Any]
@@ -451,7 +1174,7 @@ class Replayed:
 
 
 def replay(
-    cassette: dict[str, Any],
+    interactions: Iterable[dict[str, Any]],
     id_: str | None = None,
     status: str | None = None,
     uri: str | None = None,
@@ -459,24 +1182,64 @@ def replay(
     request_tls_verify: bool = True,
     request_cert: RequestCert | None = None,
     request_proxy: str | None = None,
+    workers_num: int = 1,
 ) -> Generator[Replayed, None, None]:
-    """Replay saved interactions."""
+    """Replay saved interactions.
+
+    With multiple workers, requests are sent concurrently, but results are yielded in the cassette order.
+    """
     import requests
 
-    session = requests.Session()
-    session.verify = request_tls_verify
-    session.cert = request_cert
     kwargs = {}
     if request_proxy is not None:
         kwargs["proxies"] = {"all": request_proxy}
-    for interaction in filter_cassette(cassette["http_interactions"], id_, status, uri, method):
+    sessions: list[requests.Session] = []
+    local = threading.local()
+    lock = threading.Lock()
+
+    def get_session() -> requests.Session:
+        # `requests.Session` is not thread-safe, therefore every worker has its own one
+        session = getattr(local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.verify = request_tls_verify
+            session.cert = request_cert
+            local.session = session
+            with lock:
+                sessions.append(session)
+        return session
+
+    def send(interaction: dict[str, Any]) -> Replayed:
         request = get_prepared_request(interaction["request"])
-        response = session.send(request, **kwargs)  # type: ignore
-        yield Replayed(interaction, response)
+        response = get_session().send(request, **kwargs)  # type: ignore
+        return Replayed(interaction, response)
+
+    filtered = filter_cassette(interactions, id_, status, uri, method)
+    try:
+        if workers_num <= 1:
+            for interaction in filtered:
+                yield send(interaction)
+        else:
+            with ThreadPoolExecutor(max_workers=workers_num, thread_name_prefix="schemathesis_replay") as executor:
+                pending: deque[Future[Replayed]] = deque()
+                try:
+                    for interaction in filtered:
+                        pending.append(executor.submit(send, interaction))
+                        # Bound the number of interactions in memory
+                        if len(pending) >= workers_num * REPLAY_QUEUE_SIZE_PER_WORKER:
+                            yield pending.popleft().result()
+                    while pending:
+                        yield pending.popleft().result()
+                finally:
+                    for future in pending:
+                        future.cancel()
+    finally:
+        for session in sessions:
+            session.close()
 
 
 def filter_cassette(
-    interactions: list[dict[str, Any]],
+    interactions: Iterable[dict[str, Any]],
     id_: str | None = None,
     status: str | None = None,
     uri: str | None = None,
@@ -489,7 +1252,8 @@ def filter_cassette(
 
     def status_filter(item: dict[str, Any]) -> bool:
         status_ = cast(str, status)
-        return item["status"].upper() == status_.upper()
+        # Not every cassette format stores statuses
+        return item["status"] is not None and item["status"].upper() == status_.upper()
 
     def uri_filter(item: dict[str, Any]) -> bool:
         uri_ = cast(str, uri)
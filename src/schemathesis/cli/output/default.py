@@ -47,6 +47,8 @@ if TYPE_CHECKING:
 
     import requests
 
+    from ...runner.outcomes import OutcomeCacheStatistic
+
 SPINNER_REPETITION_NUMBER = 10
 IO_ENCODING = os.getenv("PYTHONIOENCODING", "utf-8")
 
@@ -450,6 +452,10 @@ def display_statistic(context: ExecutionContext, event: events.Finished) -> None
     if total:
         display_checks_statistics(total)
 
+    if event.outcome_cache is not None:
+        click.echo()
+        display_outcome_cache_statistic(event.outcome_cache)
+
     if context.cassette_path:
         click.echo()
         category = click.style("Network log", bold=True)
@@ -668,6 +674,14 @@ def display_checks_statistics(total: dict[str, dict[str | Status, int]]) -> None
         display_check_result(check_name, results, template)
 
 
+def display_outcome_cache_statistic(statistic: OutcomeCacheStatistic) -> None:
+    category = click.style("Unique data cache", bold=True)
+    click.echo(
+        f"{category}: {statistic.size} / {statistic.capacity} entries, {statistic.hits} hits, "
+        f"{statistic.evictions} evictions, ~{statistic.memory_usage / 1024:.2f} KiB"
+    )
+
+
 def display_check_result(check_name: str, results: dict[str | Status, int], template: str) -> None:
     """Show results of single check execution."""
     if Status.failure in results:
@@ -18,6 +18,8 @@ GITHUB_APP_LINK = "https://github.com/apps/schemathesis"
 DEFAULT_DEADLINE = 15000
 DEFAULT_RESPONSE_TIMEOUT = 10000
 DEFAULT_STATEFUL_RECURSION_LIMIT = 5
+# Maximum number of test outcomes kept in memory to skip already tested cases when unique data is requested
+DEFAULT_UNIQUE_DATA_CACHE_SIZE = 100_000
 HTTP_METHODS = frozenset({"get", "put", "post", "delete", "options", "head", "patch", "trace"})
 RECURSIVE_REFERENCE_ERROR_MESSAGE = (
     "Currently, Schemathesis can't generate data for this operation due to "
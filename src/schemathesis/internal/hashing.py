@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Any
+
+# Distinct seeds for containers, so that e.g. `{}` and `[]` have different hashes
+_DICT_SEED = hash("dict")
+_LIST_SEED = hash("list")
+
+
+def hash_value(value: Any, *, as_text: bool = False) -> int:
+    """Hash arbitrary JSON-like data, including nested dictionaries and lists.
+
+    Dictionaries are hashed independently of their key order. By default, scalars are hashed together with their type
+    to tell apart values that are equal in Python but differ in JSON, like `1`, `1.0`, and `True`.
+
+    With `as_text`, scalars are hashed by their string representation and `None` dictionary values are ignored, the
+    same way as `requests` renders query parameters, headers, and form data.
+    """
+    if isinstance(value, str):
+        try:
+            return hash(value)
+        except TypeError:
+            # Unhashable subclasses, e.g. `Binary` that wraps generated bytes
+            return hash((value.__class__, repr(value)))
+    if isinstance(value, dict):
+        # Keys are unique, hence a set of entries identifies the dictionary regardless of the key order
+        return hash(
+            (
+                _DICT_SEED,
+                frozenset(
+                    (key, hash_value(item, as_text=as_text))
+                    for key, item in value.items()
+                    if not (as_text and item is None)
+                ),
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return hash((_LIST_SEED, *(hash_value(item, as_text=as_text) for item in value)))
+    if as_text:
+        return hash(str(value))
+    try:
+        return hash((value.__class__, value))
+    except TypeError:
+        # Not hashable and not a container we know how to traverse
+        return hash((value.__class__, repr(value)))
@@ -48,10 +48,12 @@ from .hooks import GLOBAL_HOOK_DISPATCHER, HookContext, HookDispatcher, dispatch
 from .internal.checks import CheckContext
 from .internal.copy import fast_deepcopy
 from .internal.deprecation import deprecated_function, deprecated_property
+from .internal.hashing import hash_value
 from .internal.output import prepare_response_payload
 from .parameters import Parameter, ParameterSet, PayloadAlternatives
 from .sanitization import sanitize_request, sanitize_response
 from .transports import ASGITransport, RequestsTransport, WSGITransport, deserialize_payload, serialize_payload
+from .transports.content_types import is_json_media_type
 from .types import Body, Cookies, FormData, Headers, NotSet, PathParameters, Query
 
 if TYPE_CHECKING:
@@ -185,6 +187,8 @@ class Case:
     data_generation_method: DataGenerationMethod | None = None
     _auth: requests.auth.AuthBase | None = None
     _has_explicit_auth: bool = False
+    # Memoized result of `__hash__`
+    _fingerprint: int | None = field(default=None, compare=False)
 
     def __repr__(self) -> str:
         parts = [f"{self.__class__.__name__}("]
@@ -200,7 +204,30 @@ class Case:
         return "".join(parts) + ")"
 
     def __hash__(self) -> int:
-        return hash(self.as_curl_command({SCHEMATHESIS_TEST_CASE_HEADER: "0"}))
+        """Structural fingerprint of the data sent by this case.
+
+        Values that end up being the same on the wire have the same fingerprint, e.g. `1` and `"1"` in query.
+        It is computed on the first call and memoized, so later mutations of the case are not reflected in it.
+        """
+        if self._fingerprint is None:
+            headers = None
+            if self.headers is not None:
+                # Header names are case-insensitive
+                headers = {key.lower(): value for key, value in self.headers.items()}
+            # Only JSON distinguishes types of scalar values, other payloads are serialized as text
+            is_json = self.media_type is not None and is_json_media_type(self.media_type)
+            self._fingerprint = hash(
+                (
+                    self.operation.verbose_name,
+                    hash_value(self.path_parameters, as_text=True),
+                    hash_value(headers, as_text=True),
+                    hash_value(self.cookies, as_text=True),
+                    hash_value(self.query, as_text=True),
+                    hash_value(self.body, as_text=not is_json),
+                    self.media_type,
+                )
+            )
+        return self._fingerprint
 
     @deprecated_property(removed_in="4.0", replacement="`operation`")
     def endpoint(self) -> APIOperation:
@@ -875,6 +902,40 @@ class Check:
     request: requests.PreparedRequest | None = None
 
 
+class _LazyBody:
+    """Body of a stored request or response that is encoded to base64 on the first access.
+
+    Bodies are stored for every interaction, but only a few writers need them as base64 strings. Raw bytes are kept
+    as is, so e.g. the compact cassette writer never encodes them at all.
+    """
+
+    __slots__ = ()
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        data = instance.__dict__
+        if "_body" not in data:
+            data["_body"] = serialize_payload(data["_raw_body"])
+        return data["_body"]
+
+    def __set__(self, instance: Any, value: str | bytes | None) -> None:
+        data = instance.__dict__
+        if isinstance(value, bytes):
+            data.pop("_body", None)
+            data["_raw_body"] = value
+        else:
+            data.pop("_raw_body", None)
+            data["_body"] = value
+
+
+def _deserialize_body(instance: Request | Response) -> bytes | None:
+    raw = instance.__dict__.get("_raw_body")
+    if raw is not None:
+        return raw
+    return deserialize_payload(instance.body)
+
+
 @dataclass(repr=False)
 class Request:
     """Request data extracted from `Case`."""
@@ -886,14 +947,28 @@ class Request:
     headers: Headers
 
     @classmethod
-    def from_case(cls, case: Case, session: requests.Session) -> Request:
-        """Create a new `Request` instance from `Case`."""
+    def from_case(
+        cls, case: Case, session: requests.Session | None = None, headers: dict[str, Any] | None = None
+    ) -> Request:
+        """Create a new `Request` instance from `Case`.
+
+        Without a session, the request gets the same default headers as `requests.Session` would add.
+        """
         import requests
+        from requests.sessions import merge_setting
+        from requests.structures import CaseInsensitiveDict
+        from requests.utils import default_headers
 
         base_url = case.get_full_base_url()
         kwargs = RequestsTransport().serialize_case(case, base_url=base_url)
-        request = requests.Request(**kwargs)
-        prepared = session.prepare_request(request)  # type: ignore
+        if session is not None:
+            request = requests.Request(**kwargs)
+            prepared = session.prepare_request(request)  # type: ignore
+        else:
+            session_headers = default_headers()
+            session_headers.update(headers or {})
+            kwargs["headers"] = merge_setting(kwargs["headers"], session_headers, dict_class=CaseInsensitiveDict)
+            prepared = requests.Request(**kwargs).prepare()
         return cls.from_prepared_request(prepared)
 
     @classmethod
@@ -912,7 +987,7 @@ class Request:
             uri=uri,
             method=method,
             headers={key: [value] for (key, value) in prepared.headers.items()},
-            body=serialize_payload(body) if body is not None else body,
+            body=body,  # type: ignore[arg-type]
             body_size=len(body) if body is not None else None,
         )
 
@@ -922,7 +997,7 @@ class Request:
         `Request` should be serializable to JSON, therefore body is encoded as base64 string
         to support arbitrary binary data.
         """
-        return deserialize_payload(self.body)
+        return _deserialize_body(self)
 
 
 @dataclass(repr=False)
@@ -949,18 +1024,14 @@ class Response:
         version = raw.version if raw is not None else 10
         http_version = "1.0" if version == 10 else "1.1"
 
-        def is_empty(_response: requests.Response) -> bool:
-            # Assume the response is empty if:
-            #   - no `Content-Length` header
-            #   - no chunks when iterating over its content
-            return "Content-Length" not in headers and list(_response.iter_content()) == []
-
-        body = None if is_empty(response) else serialize_payload(response.content)
+        content = response.content
+        # Assume the response is empty if there is no `Content-Length` header and no content
+        body = None if "Content-Length" not in headers and not content else content
         return cls(
             status_code=response.status_code,
             message=response.reason,
-            body=body,
-            body_size=len(response.content) if body is not None else None,
+            body=body,  # type: ignore[arg-type]
+            body_size=len(body) if body is not None else None,
             encoding=response.encoding,
             headers=headers,
             http_version=http_version,
@@ -977,7 +1048,7 @@ class Response:
         headers = {name: response.headers.getlist(name) for name in response.headers.keys()}
         # Note, this call ensures that `response.response` is a sequence, which is needed for comparison
         data = response.get_data()
-        body = None if response.response == [] else serialize_payload(data)
+        body = None if response.response == [] else data
         encoding: str | None
         if body is not None:
             # Werkzeug <3.0 had `charset` attr, newer versions always have UTF-8
@@ -987,7 +1058,7 @@ class Response:
         return cls(
             status_code=response.status_code,
             message=message,
-            body=body,
+            body=body,  # type: ignore[arg-type]
             body_size=len(data) if body is not None else None,
             encoding=encoding,
             headers=headers,
@@ -1002,7 +1073,11 @@ class Response:
         `Response` should be serializable to JSON, therefore body is encoded as base64 string
         to support arbitrary binary data.
         """
-        return deserialize_payload(self.body)
+        return _deserialize_body(self)
+
+
+# Raw bodies are encoded to base64 only when needed
+Request.body = Response.body = _LazyBody()  # type: ignore[assignment]
 
 
 TIMEZONE = datetime.datetime.now(datetime.timezone.utc).astimezone().tzinfo
@@ -1035,12 +1110,7 @@ class Interaction:
             prepared = response.request
             request = Request.from_prepared_request(prepared)
         else:
-            import requests
-
-            if session is None:
-                session = requests.Session()
-                session.headers.update(headers or {})
-            request = Request.from_case(case, session)
+            request = Request.from_case(case, session, headers)
         return cls(
             request=request,
             response=Response.from_requests(response) if response is not None else None,
@@ -1061,12 +1131,8 @@ class Interaction:
         status: Status,
         checks: list[Check],
     ) -> Interaction:
-        import requests
-
-        session = requests.Session()
-        session.headers.update(headers)
         return cls(
-            request=Request.from_case(case, session),
+            request=Request.from_case(case, headers=headers),
             response=Response.from_wsgi(response, elapsed) if response is not None and elapsed is not None else None,
             status=status,
             checks=checks,
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from random import Random
-from typing import TYPE_CHECKING, Any, Callable, Generator, Iterable
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterable, Literal
 from urllib.parse import urlparse
 
 from ..constants import (
     DEFAULT_DEADLINE,
     DEFAULT_STATEFUL_RECURSION_LIMIT,
+    DEFAULT_UNIQUE_DATA_CACHE_SIZE,
     HYPOTHESIS_IN_MEMORY_DATABASE_IDENTIFIER,
 )
 from ..exceptions import SchemaError
@@ -334,6 +335,7 @@ def from_schema(
     max_response_time: int | None = None,
     targets: Iterable[Target] = DEFAULT_TARGETS,
     workers_num: int = 1,
+    workers_mode: Literal["threads", "asyncio", "processes"] = "threads",
     hypothesis_settings: hypothesis.settings | None = None,
     generation_config: GenerationConfig | None = None,
     auth: RawAuth | None = None,
@@ -348,6 +350,7 @@ def from_schema(
     max_failures: int | None = None,
     started_at: str | None = None,
     unique_data: bool = False,
+    unique_data_cache_size: int = DEFAULT_UNIQUE_DATA_CACHE_SIZE,
     dry_run: bool = False,
     store_interactions: bool = False,
     stateful: Stateful | None = None,
@@ -362,6 +365,8 @@ def from_schema(
     from ..checks import DEFAULT_CHECKS
     from ..transports.asgi import is_asgi_app
     from .impl import (
+        AsyncioRunner,
+        ProcessPoolRunner,
         SingleThreadASGIRunner,
         SingleThreadRunner,
         SingleThreadWSGIRunner,
@@ -388,7 +393,12 @@ def from_schema(
     started_at = started_at or current_datetime()
     if workers_num > 1:
         if not schema.app:
-            return ThreadPoolRunner(
+            runner_cls = {
+                "threads": ThreadPoolRunner,
+                "asyncio": AsyncioRunner,
+                "processes": ProcessPoolRunner,
+            }[workers_mode]
+            return runner_cls(
                 schema=schema,
                 checks=checks,
                 max_response_time=max_response_time,
@@ -406,6 +416,7 @@ def from_schema(
                 max_failures=max_failures,
                 started_at=started_at,
                 unique_data=unique_data,
+                unique_data_cache_size=unique_data_cache_size,
                 dry_run=dry_run,
                 store_interactions=store_interactions,
                 stateful=stateful,
@@ -432,6 +443,7 @@ def from_schema(
                 max_failures=max_failures,
                 started_at=started_at,
                 unique_data=unique_data,
+                unique_data_cache_size=unique_data_cache_size,
                 dry_run=dry_run,
                 store_interactions=store_interactions,
                 stateful=stateful,
@@ -458,6 +470,7 @@ def from_schema(
             max_failures=max_failures,
             started_at=started_at,
             unique_data=unique_data,
+            unique_data_cache_size=unique_data_cache_size,
             dry_run=dry_run,
             store_interactions=store_interactions,
             stateful=stateful,
@@ -485,6 +498,7 @@ def from_schema(
             max_failures=max_failures,
             started_at=started_at,
             unique_data=unique_data,
+            unique_data_cache_size=unique_data_cache_size,
             dry_run=dry_run,
             store_interactions=store_interactions,
             stateful=stateful,
@@ -511,6 +525,7 @@ def from_schema(
             max_failures=max_failures,
             started_at=started_at,
             unique_data=unique_data,
+            unique_data_cache_size=unique_data_cache_size,
             dry_run=dry_run,
             store_interactions=store_interactions,
             stateful=stateful,
@@ -536,6 +551,7 @@ def from_schema(
         max_failures=max_failures,
         started_at=started_at,
         unique_data=unique_data,
+        unique_data_cache_size=unique_data_cache_size,
         dry_run=dry_run,
         store_interactions=store_interactions,
         stateful=stateful,
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from ..service.models import AnalysisResult
     from ..stateful import events
     from . import probes
+    from .outcomes import OutcomeCacheStatistic
 
 
 @dataclass
@@ -360,10 +361,17 @@ class Finished(ExecutionEvent):
 
     # Total test run execution time
     running_time: float
+    # Usage of the outcome cache, available only if unique data generation is enabled
+    outcome_cache: OutcomeCacheStatistic | None = None
     thread_id: int = field(default_factory=threading.get_ident)
 
     @classmethod
-    def from_results(cls, results: TestResultSet, running_time: float) -> Finished:
+    def from_results(
+        cls,
+        results: TestResultSet,
+        running_time: float,
+        outcome_cache: OutcomeCacheStatistic | None = None,
+    ) -> Finished:
         return cls(
             passed_count=results.passed_count,
             skipped_count=results.skipped_count,
@@ -386,4 +394,5 @@ class Finished(ExecutionEvent):
             ],
             warnings=results.warnings,
             running_time=running_time,
+            outcome_cache=outcome_cache,
         )
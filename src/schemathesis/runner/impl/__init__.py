@@ -1,3 +1,5 @@
+from .asynchronous import AsyncioRunner
 from .core import BaseRunner
+from .processpool import ProcessPoolRunner
 from .solo import SingleThreadASGIRunner, SingleThreadRunner, SingleThreadWSGIRunner
 from .threadpool import ThreadPoolASGIRunner, ThreadPoolRunner, ThreadPoolWSGIRunner
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import http.client
+import io
+import threading
+import warnings
+from dataclasses import dataclass
+from queue import Queue
+from typing import TYPE_CHECKING, Any, Generator
+
+import requests
+from hypothesis.errors import HypothesisWarning
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+from urllib3._collections import HTTPHeaderDict
+
+from ...transports.auth import get_requests_auth
+from ...utils import capture_hypothesis_output
+from .. import events
+from .core import BaseRunner, get_session, network_test
+from .threadpool import run_operation
+
+if TYPE_CHECKING:
+    import httpx
+
+    from ...exceptions import OperationSchemaError
+    from ...internal.result import Result
+    from ...models import APIOperation
+    from ...transports import RequestConfig
+    from .context import RunnerContext
+
+# Marks the end of the event stream produced by the event loop thread
+_FINISHED = object()
+
+
+class _OriginalResponse:
+    """Minimal stand-in for `http.client.HTTPResponse` to let `requests` extract cookies from the response."""
+
+    __slots__ = ("msg",)
+
+    def __init__(self, msg: http.client.HTTPMessage) -> None:
+        self.msg = msg
+
+    def isclosed(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncioAdapter(HTTPAdapter):
+    """Transport adapter for `requests` that sends requests via a shared `httpx.AsyncClient`.
+
+    Requests are prepared by `requests` as usual (auth, cookies, redirects), but the network I/O happens in the event
+    loop, so all workers share a single connection pool.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+        super().__init__()
+        self.client = client
+        self.loop = loop
+        self._pending: set[concurrent.futures.Future] = set()
+        self._lock = threading.Lock()
+        self._is_cancelled = False
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: bool | str = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> requests.Response:
+        # TLS & proxy settings are configured once for the whole client
+        with self._lock:
+            if self._is_cancelled:
+                raise KeyboardInterrupt
+            future = asyncio.run_coroutine_threadsafe(self._send(request, timeout), self.loop)
+            self._pending.add(future)
+        try:
+            concurrent.futures.wait((future,))
+            # `future.result()` raises from different lines depending on whether the future is already done, which
+            # makes tracebacks of identical errors differ
+            exc = future.exception()
+        except concurrent.futures.CancelledError:
+            raise KeyboardInterrupt from None
+        finally:
+            with self._lock:
+                self._pending.discard(future)
+        if exc is not None:
+            raise exc
+        return self.build_response(request, future.result())
+
+    async def _send(self, request: requests.PreparedRequest, timeout: Any) -> HTTPResponse:
+        import httpx
+
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        # Build the request directly to avoid adding the client's default headers
+        http_request = httpx.Request(
+            method=request.method or "GET",
+            url=request.url or "",
+            headers=list(request.headers.items()),
+            content=body,
+            extensions={"timeout": _prepare_timeout(timeout).as_dict()},
+        )
+        try:
+            response = await self.client.send(http_request, stream=True)
+            try:
+                # Keep the payload as is, `urllib3` decodes it the same way as for a regular `requests` call
+                content = b"".join([chunk async for chunk in response.aiter_raw()])
+            finally:
+                await response.aclose()
+        # Tracebacks from `httpx` internals depend on the connection pool state and would prevent deduplicating errors
+        except httpx.ConnectTimeout as exc:
+            raise requests.ConnectTimeout(exc, request=request) from None
+        except httpx.TimeoutException as exc:
+            raise requests.ReadTimeout(exc, request=request) from None
+        except httpx.TransportError as exc:
+            raise requests.ConnectionError(exc, request=request) from None
+        headers = HTTPHeaderDict()
+        message = http.client.HTTPMessage()
+        encoding = response.headers.encoding
+        # `multi_items` lowercases names, raw headers preserve them as sent by the server
+        for raw_name, raw_value in response.headers.raw:
+            name, value = raw_name.decode(encoding), raw_value.decode(encoding)
+            headers.add(name, value)
+            message[name] = value
+        return HTTPResponse(
+            body=io.BytesIO(content),
+            headers=headers,
+            status=response.status_code,
+            version=10 if response.http_version == "HTTP/1.0" else 11,
+            reason=response.reason_phrase,
+            preload_content=False,
+            decode_content=True,
+            original_response=_OriginalResponse(message),  # type: ignore[arg-type]
+            request_method=request.method,
+        )
+
+    def cancel(self) -> None:
+        """Interrupt all in-flight requests and reject new ones."""
+        with self._lock:
+            self._is_cancelled = True
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+
+    def close(self) -> None:
+        # The underlying client is owned by the runner
+        pass
+
+
+def _prepare_timeout(timeout: Any) -> httpx.Timeout:
+    import httpx
+
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return httpx.Timeout(timeout)
+
+
+def _create_client(request_config: RequestConfig, max_connections: int) -> httpx.AsyncClient:
+    import httpx
+
+    transport = httpx.AsyncHTTPTransport(
+        verify=request_config.tls_verify,
+        cert=request_config.cert,  # type: ignore[arg-type]
+        proxy=httpx.Proxy(request_config.proxy) if request_config.proxy is not None else None,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+    )
+    return httpx.AsyncClient(transport=transport)
+
+
+@dataclass
+class AsyncioRunner(BaseRunner):
+    """Run tests concurrently with network I/O driven by a single event loop.
+
+    Hypothesis tests are synchronous, therefore every in-flight test occupies a thread from a bounded pool, but all
+    requests go through one `httpx.AsyncClient` and its connection pool instead of a `requests.Session` per worker.
+    """
+
+    workers_num: int = 2
+
+    def _execute(self, ctx: RunnerContext) -> Generator[events.ExecutionEvent, None, None]:
+        events_queue: Queue = Queue()
+        loop = asyncio.new_event_loop()
+        client = _create_client(self.request_config, self.workers_num)
+        adapter = AsyncioAdapter(client, loop)
+        stop_scheduling = threading.Event()
+        loop_thread = threading.Thread(
+            target=self._run_event_loop,
+            kwargs={
+                "loop": loop,
+                "client": client,
+                "adapter": adapter,
+                "ctx": ctx,
+                "events_queue": events_queue,
+                "stop_scheduling": stop_scheduling,
+            },
+            name="schemathesis_asyncio",
+        )
+        loop_thread.start()
+
+        def stop() -> None:
+            stop_scheduling.set()
+            adapter.cancel()
+            # Drain the remaining events, so the event loop thread can finish
+            while events_queue.get() is not _FINISHED:
+                pass
+            loop_thread.join()
+
+        try:
+            while True:
+                event = events_queue.get()
+                if event is _FINISHED:
+                    loop_thread.join()
+                    break
+                if ctx.is_stopped or isinstance(event, events.Interrupted) or self._should_stop(event):
+                    stop()
+                    if ctx.is_stopped:
+                        # Discard the event. The invariant is: the next event after `stream.stop()` is `Finished`
+                        break
+                    yield event
+                    break
+                yield event
+        except KeyboardInterrupt:
+            stop()
+            yield events.Interrupted()
+
+    def _run_event_loop(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        client: httpx.AsyncClient,
+        adapter: AsyncioAdapter,
+        ctx: RunnerContext,
+        events_queue: Queue,
+        stop_scheduling: threading.Event,
+    ) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._run(loop, client, adapter, ctx, events_queue, stop_scheduling))
+        finally:
+            loop.close()
+            events_queue.put(_FINISHED)
+
+    async def _run(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        client: httpx.AsyncClient,
+        adapter: AsyncioAdapter,
+        ctx: RunnerContext,
+        events_queue: Queue,
+        stop_scheduling: threading.Event,
+    ) -> None:
+        semaphore = asyncio.Semaphore(self.workers_num)
+        in_flight: set[asyncio.Future] = set()
+        auth = get_requests_auth(self.auth, self.auth_type)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.workers_num, thread_name_prefix="schemathesis"
+        ) as executor, get_session(auth) as session:
+            for prefix in ("http://", "https://"):
+                session.mount(prefix, adapter)
+            try:
+                for result in self.schema.get_all_operations(generation_config=self.generation_config):
+                    await semaphore.acquire()
+                    if stop_scheduling.is_set():
+                        semaphore.release()
+                        break
+                    future = loop.run_in_executor(executor, self._run_operation, result, session, ctx, events_queue)
+                    in_flight.add(future)
+                    future.add_done_callback(in_flight.discard)
+                    future.add_done_callback(lambda _: semaphore.release())
+                if in_flight:
+                    await asyncio.wait(in_flight)
+            finally:
+                # Workers block on the event loop while waiting for responses, therefore they should be done before
+                # the executor shuts down. Otherwise, an error in scheduling would lead to a deadlock
+                adapter.cancel()
+                if in_flight:
+                    await asyncio.wait(in_flight)
+                await client.aclose()
+
+    def _run_operation(
+        self,
+        result: Result[APIOperation, OperationSchemaError],
+        session: requests.Session,
+        ctx: RunnerContext,
+        events_queue: Queue,
+    ) -> None:
+        warnings.filterwarnings("ignore", message="The recursion limit will not be reset", category=HypothesisWarning)
+        with capture_hypothesis_output():
+            try:
+                run_operation(
+                    result,
+                    test_func=network_test,
+                    events_queue=events_queue,
+                    checks=self.checks,
+                    targets=self.targets,
+                    data_generation_methods=self.schema.data_generation_methods,
+                    settings=self.hypothesis_settings,
+                    generation_config=self.generation_config,
+                    ctx=ctx,
+                    stateful=self.stateful,
+                    stateful_recursion_limit=self.stateful_recursion_limit,
+                    session=session,
+                    headers=self.headers,
+                    request_config=self.request_config,
+                    store_interactions=self.store_interactions,
+                    max_response_time=self.max_response_time,
+                    dry_run=self.dry_run,
+                )
+            except KeyboardInterrupt:
+                # The run is being stopped, the remaining events are discarded anyway
+                pass
@@ -3,8 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from ...constants import NOT_SET
+from ...constants import DEFAULT_UNIQUE_DATA_CACHE_SIZE
 from ...models import TestResult, TestResultSet
+from ..outcomes import OutcomeCache
 
 if TYPE_CHECKING:
     import threading
@@ -23,18 +24,24 @@ class RunnerContext:
     seed: int | None
     stop_event: threading.Event
     unique_data: bool
-    outcome_cache: dict[int, BaseException | None]
+    outcome_cache: OutcomeCache
 
     __slots__ = ("data", "auth", "seed", "stop_event", "unique_data", "outcome_cache")
 
     def __init__(
-        self, *, seed: int | None, auth: RawAuth | None, stop_event: threading.Event, unique_data: bool
+        self,
+        *,
+        seed: int | None,
+        auth: RawAuth | None,
+        stop_event: threading.Event,
+        unique_data: bool,
+        outcome_cache_size: int = DEFAULT_UNIQUE_DATA_CACHE_SIZE,
     ) -> None:
         self.data = TestResultSet(seed=seed)
         self.auth = auth
         self.seed = seed
         self.stop_event = stop_event
-        self.outcome_cache = {}
+        self.outcome_cache = OutcomeCache(capacity=outcome_cache_size)
         self.unique_data = unique_data
 
     @property
@@ -67,10 +74,10 @@ class RunnerContext:
         self.data.add_warning(message)
 
     def cache_outcome(self, case: Case, outcome: BaseException | None) -> None:
-        self.outcome_cache[hash(case)] = outcome
+        self.outcome_cache.put(hash(case), outcome)
 
     def get_cached_outcome(self, case: Case) -> BaseException | None | NotSet:
-        return self.outcome_cache.get(hash(case), NOT_SET)
+        return self.outcome_cache.get(hash(case))
 
 
 ALL_NOT_FOUND_WARNING_MESSAGE = "All API responses have a 404 status code. Did you specify the proper API location?"
@@ -36,6 +36,7 @@ from ...auths import unregister as unregister_auth
 from ...checks import _make_max_response_time_failure_message
 from ...constants import (
     DEFAULT_STATEFUL_RECURSION_LIMIT,
+    DEFAULT_UNIQUE_DATA_CACHE_SIZE,
     RECURSIVE_REFERENCE_ERROR_MESSAGE,
     SERIALIZERS_SUGGESTION_MESSAGE,
     USER_AGENT,
@@ -113,6 +114,7 @@ class BaseRunner:
     max_failures: int | None = None
     started_at: str = field(default_factory=current_datetime)
     unique_data: bool = False
+    unique_data_cache_size: int = DEFAULT_UNIQUE_DATA_CACHE_SIZE
     dry_run: bool = False
     stateful: Stateful | None = None
     stateful_recursion_limit: int = DEFAULT_STATEFUL_RECURSION_LIMIT
@@ -131,7 +133,13 @@ class BaseRunner:
         # If auth is explicitly provided, then the global provider is ignored
         if self.auth is not None:
             unregister_auth()
-        ctx = RunnerContext(auth=self.auth, seed=self.seed, stop_event=stop_event, unique_data=self.unique_data)
+        ctx = RunnerContext(
+            auth=self.auth,
+            seed=self.seed,
+            stop_event=stop_event,
+            unique_data=self.unique_data,
+            outcome_cache_size=self.unique_data_cache_size,
+        )
         start_time = time.monotonic()
         initialized = None
         __probes = None
@@ -151,7 +159,11 @@ class BaseRunner:
         def _finish() -> events.Finished:
             if ctx.has_all_not_found:
                 ctx.add_warning(ALL_NOT_FOUND_WARNING_MESSAGE)
-            return events.Finished.from_results(results=ctx.data, running_time=time.monotonic() - start_time)
+            return events.Finished.from_results(
+                results=ctx.data,
+                running_time=time.monotonic() - start_time,
+                outcome_cache=ctx.outcome_cache.get_statistic() if ctx.unique_data else None,
+            )
 
         def _before_probes() -> events.BeforeProbing:
             return events.BeforeProbing()
@@ -260,6 +272,8 @@ class BaseRunner:
                 auth=auth,
                 seed=ctx.seed,
                 override=self.override,
+                # Only concurrent runners have multiple workers
+                workers_num=getattr(self, "workers_num", 1),
             )
             state_machine = self.schema.as_state_machine()
             runner = state_machine.runner(config=config)
@@ -1048,6 +1062,15 @@ def get_session(auth: HTTPDigestAuth | RawAuth | None = None) -> Generator[reque
         yield session
 
 
+@contextmanager
+def get_asgi_session(app: Any) -> Generator[requests.Session, None, None]:
+    """Open an ASGI client that runs the app's lifespan once for all requests sent through it."""
+    from starlette_testclient import TestClient as ASGIClient
+
+    with ASGIClient(app) as client:
+        yield client
+
+
 @cached_test_func
 def wsgi_test(
     ctx: RunnerContext,
@@ -1139,6 +1162,7 @@ def asgi_test(
     checks: Iterable[CheckFunction],
     targets: Iterable[Target],
     result: TestResult,
+    session: requests.Session,
     store_interactions: bool,
     headers: dict[str, Any] | None,
     feedback: Feedback | None,
@@ -1159,6 +1183,7 @@ def asgi_test(
                 checks,
                 targets,
                 result,
+                session,
                 store_interactions,
                 headers,
                 feedback,
@@ -1176,13 +1201,14 @@ def _asgi_test(
     checks: Iterable[CheckFunction],
     targets: Iterable[Target],
     result: TestResult,
+    session: requests.Session,
     store_interactions: bool,
     headers: dict[str, Any] | None,
     feedback: Feedback | None,
     max_response_time: int | None,
 ) -> requests.Response:
     hook_context = HookContext(operation=case.operation)
-    kwargs: dict[str, Any] = {"headers": headers}
+    kwargs: dict[str, Any] = {"session": session, "headers": headers}
     hooks.dispatch("process_call_kwargs", hook_context, case, kwargs)
     response = case.call(**kwargs)
     context = TargetContext(case=case, response=response, response_time=response.elapsed.total_seconds())
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import threading
+import warnings
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generator
+
+from hypothesis.errors import HypothesisWarning
+
+from ...internal.result import Ok
+from ...transports.auth import get_requests_auth
+from ...utils import capture_hypothesis_output
+from .. import events
+from .context import RunnerContext
+from .core import BaseRunner, get_session, handle_schema_error, network_test
+from .threadpool import run_operation
+
+if TYPE_CHECKING:
+    from multiprocessing.context import ForkContext, ForkProcess
+    from multiprocessing.sharedctypes import Synchronized
+
+    from ...models import APIOperation
+    from ..outcomes import OutcomeCacheStatistic
+
+# How often the main process checks whether workers are still alive while waiting for events
+WORKER_LIVENESS_INTERVAL = 1.0
+
+
+@dataclass
+class _Warning:
+    """A warning added to the worker's context."""
+
+    message: str
+
+    __slots__ = ("message",)
+
+
+@dataclass
+class _WorkerFinished:
+    """A worker has no more operations to test."""
+
+    outcome_cache: OutcomeCacheStatistic | None
+
+    __slots__ = ("outcome_cache",)
+
+
+class _WorkerContext(RunnerContext):
+    """Runner context inside a worker process.
+
+    Test results are merged by the main process from `AfterExecution` events, while warnings are forwarded explicitly.
+    """
+
+    __slots__ = ("events_queue",)
+
+    def __init__(self, *, events_queue: multiprocessing.Queue, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.events_queue = events_queue
+
+    def add_warning(self, message: str) -> None:
+        self.events_queue.put(_Warning(message))
+
+
+def _get_fork_context() -> ForkContext:
+    if "fork" not in multiprocessing.get_all_start_methods():
+        raise RuntimeError("Running tests in multiple processes requires the `fork` start method")
+    return multiprocessing.get_context("fork")
+
+
+@dataclass
+class ProcessPoolRunner(BaseRunner):
+    """Spread different API operations among multiple worker processes.
+
+    Operations are resolved once in the main process and inherited by the workers when they are forked. Workers claim
+    operations one by one via a shared counter, so slow operations don't hold back the rest of the shard. Events are
+    sent back through a pipe in their serialized form.
+    """
+
+    workers_num: int = 2
+
+    def _execute(self, ctx: RunnerContext) -> Generator[events.ExecutionEvent, None, None]:
+        mp_context = _get_fork_context()
+        operations: list[APIOperation] = []
+        for result in self.schema.get_all_operations(generation_config=self.generation_config):
+            if isinstance(result, Ok):
+                operations.append(result.ok())
+            else:
+                # Errors are cheap to report, there is no reason to send them to workers
+                for event in handle_schema_error(result.err(), ctx, self.schema.data_generation_methods, 0):
+                    if ctx.is_stopped:
+                        return
+                    yield event
+                    if self._should_stop(event):
+                        return
+        if not operations:
+            return
+        events_queue: multiprocessing.Queue = mp_context.Queue()
+        counter = mp_context.Value("i", 0)
+        workers = [
+            mp_context.Process(
+                target=self._run_worker,
+                kwargs={"operations": operations, "counter": counter, "events_queue": events_queue, "ctx": ctx},
+                name=f"schemathesis_{num}",
+                daemon=True,
+            )
+            for num in range(min(self.workers_num, len(operations)))
+        ]
+        for worker in workers:
+            worker.start()
+
+        def stop_workers() -> None:
+            for worker in workers:
+                worker.terminate()
+            for worker in workers:
+                worker.join()
+
+        running = len(workers)
+        try:
+            while running:
+                try:
+                    message = events_queue.get(timeout=WORKER_LIVENESS_INTERVAL)
+                except queue.Empty:
+                    _check_workers(workers)
+                    continue
+                if isinstance(message, _WorkerFinished):
+                    running -= 1
+                    if message.outcome_cache is not None:
+                        ctx.outcome_cache.merge_statistic(message.outcome_cache)
+                    continue
+                if isinstance(message, _Warning):
+                    ctx.add_warning(message.message)
+                    continue
+                event = message
+                if isinstance(event, events.AfterExecution):
+                    # Serialized results provide the same summary attributes as `TestResult`
+                    ctx.add_result(event.result)  # type: ignore[arg-type]
+                if ctx.is_stopped or isinstance(event, events.Interrupted) or self._should_stop(event):
+                    stop_workers()
+                    if ctx.is_stopped:
+                        # Discard the event. The invariant is: the next event after `stream.stop()` is `Finished`
+                        return
+                    yield event
+                    return
+                yield event
+            for worker in workers:
+                worker.join()
+        except KeyboardInterrupt:
+            stop_workers()
+            yield events.Interrupted()
+        finally:
+            events_queue.close()
+
+    def _run_worker(
+        self,
+        operations: list[APIOperation],
+        counter: Synchronized,
+        events_queue: multiprocessing.Queue,
+        ctx: RunnerContext,
+    ) -> None:
+        warnings.filterwarnings("ignore", message="The recursion limit will not be reset", category=HypothesisWarning)
+        worker_ctx = _WorkerContext(
+            events_queue=events_queue,
+            seed=ctx.seed,
+            auth=ctx.auth,
+            # The main process terminates workers when the run is stopped
+            stop_event=threading.Event(),
+            unique_data=ctx.unique_data,
+            outcome_cache_size=ctx.outcome_cache.capacity,
+        )
+        auth = get_requests_auth(self.auth, self.auth_type)
+        try:
+            with capture_hypothesis_output(), get_session(auth) as session:
+                while True:
+                    with counter.get_lock():
+                        idx = counter.value
+                        counter.value += 1
+                    if idx >= len(operations):
+                        break
+                    run_operation(
+                        Ok(operations[idx]),
+                        test_func=network_test,
+                        events_queue=events_queue,  # type: ignore[arg-type]
+                        checks=self.checks,
+                        targets=self.targets,
+                        data_generation_methods=self.schema.data_generation_methods,
+                        settings=self.hypothesis_settings,
+                        generation_config=self.generation_config,
+                        ctx=worker_ctx,
+                        stateful=self.stateful,
+                        stateful_recursion_limit=self.stateful_recursion_limit,
+                        session=session,
+                        headers=self.headers,
+                        request_config=self.request_config,
+                        store_interactions=self.store_interactions,
+                        max_response_time=self.max_response_time,
+                        dry_run=self.dry_run,
+                    )
+        except KeyboardInterrupt:
+            # The main process receives the same signal and stops the run
+            pass
+        finally:
+            events_queue.put(
+                _WorkerFinished(
+                    outcome_cache=worker_ctx.outcome_cache.get_statistic() if worker_ctx.unique_data else None
+                )
+            )
+
+
+def _check_workers(workers: list[ForkProcess]) -> None:
+    for worker in workers:
+        if not worker.is_alive() and worker.exitcode not in (0, None):
+            raise RuntimeError(f"Worker process `{worker.name}` exited unexpectedly with code {worker.exitcode}")
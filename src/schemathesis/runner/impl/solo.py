@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Generator
 
 from ...transports.auth import get_requests_auth
 from .. import events
-from .core import BaseRunner, asgi_test, get_session, network_test, wsgi_test
+from .core import BaseRunner, asgi_test, get_asgi_session, get_session, network_test, wsgi_test
 
 if TYPE_CHECKING:
     from .. import events
@@ -65,16 +65,18 @@ class SingleThreadWSGIRunner(SingleThreadRunner):
 @dataclass
 class SingleThreadASGIRunner(SingleThreadRunner):
     def _execute_impl(self, ctx: RunnerContext) -> Generator[events.ExecutionEvent, None, None]:
-        yield from self._run_tests(
-            maker=self.schema.get_all_tests,
-            test_func=asgi_test,
-            settings=self.hypothesis_settings,
-            generation_config=self.generation_config,
-            checks=self.checks,
-            max_response_time=self.max_response_time,
-            targets=self.targets,
-            ctx=ctx,
-            headers=self.headers,
-            store_interactions=self.store_interactions,
-            dry_run=self.dry_run,
-        )
+        with get_asgi_session(self.schema.app) as session:
+            yield from self._run_tests(
+                maker=self.schema.get_all_tests,
+                test_func=asgi_test,
+                settings=self.hypothesis_settings,
+                generation_config=self.generation_config,
+                checks=self.checks,
+                max_response_time=self.max_response_time,
+                targets=self.targets,
+                ctx=ctx,
+                session=session,
+                headers=self.headers,
+                store_interactions=self.store_interactions,
+                dry_run=self.dry_run,
+            )
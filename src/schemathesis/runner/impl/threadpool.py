@@ -1,9 +1,7 @@
 from __future__ import annotations
 
 import ctypes
-import queue
 import threading
-import time
 import warnings
 from dataclasses import dataclass
 from queue import Queue
@@ -17,24 +15,41 @@ from ...stateful import Feedback, Stateful
 from ...transports.auth import get_requests_auth
 from ...utils import capture_hypothesis_output
 from .. import events
-from .core import BaseRunner, asgi_test, get_session, handle_schema_error, network_test, run_test, wsgi_test
+from .core import (
+    BaseRunner,
+    asgi_test,
+    get_asgi_session,
+    get_session,
+    handle_schema_error,
+    network_test,
+    run_test,
+    wsgi_test,
+)
 
 if TYPE_CHECKING:
     import hypothesis
 
+    from ...exceptions import OperationSchemaError
     from ...generation import DataGenerationMethod, GenerationConfig
     from ...internal.checks import CheckFunction
+    from ...internal.result import Result
+    from ...models import APIOperation
     from ...targets import Target
     from ...types import RawAuth
     from .context import RunnerContext
 
 
+# Tells a worker that there are no more tasks
+NO_MORE_TASKS = object()
+# Sent by a worker to the events queue right before it exits
+WORKER_FINISHED = object()
+
+
 def _run_task(
     *,
     test_func: Callable,
     tasks_queue: Queue,
     events_queue: Queue,
-    generator_done: threading.Event,
     checks: Iterable[CheckFunction],
     targets: Iterable[Target],
     data_generation_methods: Iterable[DataGenerationMethod],
@@ -47,6 +62,49 @@ def _run_task(
     **kwargs: Any,
 ) -> None:
     warnings.filterwarnings("ignore", message="The recursion limit will not be reset", category=HypothesisWarning)
+    try:
+        with capture_hypothesis_output():
+            while True:
+                # Block until there is a new task, the main thread sends `NO_MORE_TASKS` when the work is done
+                result = tasks_queue.get()
+                if result is NO_MORE_TASKS:
+                    break
+                run_operation(
+                    result,
+                    test_func=test_func,
+                    events_queue=events_queue,
+                    checks=checks,
+                    targets=targets,
+                    data_generation_methods=data_generation_methods,
+                    settings=settings,
+                    generation_config=generation_config,
+                    ctx=ctx,
+                    stateful=stateful,
+                    stateful_recursion_limit=stateful_recursion_limit,
+                    headers=headers,
+                    **kwargs,
+                )
+    finally:
+        events_queue.put(WORKER_FINISHED)
+
+
+def run_operation(
+    result: Result[APIOperation, OperationSchemaError],
+    *,
+    test_func: Callable,
+    events_queue: Queue,
+    checks: Iterable[CheckFunction],
+    targets: Iterable[Target],
+    data_generation_methods: Iterable[DataGenerationMethod],
+    settings: hypothesis.settings,
+    generation_config: GenerationConfig,
+    ctx: RunnerContext,
+    stateful: Stateful | None,
+    stateful_recursion_limit: int,
+    headers: dict[str, Any] | None = None,
+    **kwargs: Any,
+) -> None:
+    """Run tests for a single API operation in the current thread and push their events to the queue."""
     as_strategy_kwargs = {}
     if headers is not None:
         as_strategy_kwargs["headers"] = {key: value for key, value in headers.items() if key.lower() != "user-agent"}
@@ -79,40 +137,29 @@ def _run_task(
                 events_queue.put(_event)
             _run_tests(feedback.get_stateful_tests, recursion_level + 1)
 
-    with capture_hypothesis_output():
-        while True:
-            try:
-                result = tasks_queue.get(timeout=0.001)
-            except queue.Empty:
-                # The queue is empty & there will be no more tasks
-                if generator_done.is_set():
-                    break
-                # If there is a possibility for new tasks - try again
-                continue
-            if isinstance(result, Ok):
-                operation = result.ok()
-                test_function = create_test(
-                    operation=operation,
-                    test=test_func,
-                    settings=settings,
-                    seed=ctx.seed,
-                    data_generation_methods=list(data_generation_methods),
-                    generation_config=generation_config,
-                    as_strategy_kwargs=as_strategy_kwargs,
-                )
-                items = Ok((operation, test_function))
-                # This lambda ignores the input arguments to support the same interface for
-                # `feedback.get_stateful_tests`
-                _run_tests(lambda *_, **__: (items,))  # noqa: B023
-            else:
-                for event in handle_schema_error(result.err(), ctx, data_generation_methods, 0):
-                    events_queue.put(event)
+    if isinstance(result, Ok):
+        operation = result.ok()
+        test_function = create_test(
+            operation=operation,
+            test=test_func,
+            settings=settings,
+            seed=ctx.seed,
+            data_generation_methods=list(data_generation_methods),
+            generation_config=generation_config,
+            as_strategy_kwargs=as_strategy_kwargs,
+        )
+        items = Ok((operation, test_function))
+        # This lambda ignores the input arguments to support the same interface for
+        # `feedback.get_stateful_tests`
+        _run_tests(lambda *_, **__: (items,))
+    else:
+        for event in handle_schema_error(result.err(), ctx, data_generation_methods, 0):
+            events_queue.put(event)
 
 
 def thread_task(
     tasks_queue: Queue,
     events_queue: Queue,
-    generator_done: threading.Event,
     checks: Iterable[CheckFunction],
     targets: Iterable[Target],
     data_generation_methods: Iterable[DataGenerationMethod],
@@ -136,7 +183,6 @@ def thread_task(
             test_func=network_test,
             tasks_queue=tasks_queue,
             events_queue=events_queue,
-            generator_done=generator_done,
             checks=checks,
             targets=targets,
             data_generation_methods=data_generation_methods,
@@ -154,7 +200,6 @@ def thread_task(
 def wsgi_thread_task(
     tasks_queue: Queue,
     events_queue: Queue,
-    generator_done: threading.Event,
     checks: Iterable[CheckFunction],
     targets: Iterable[Target],
     data_generation_methods: Iterable[DataGenerationMethod],
@@ -169,7 +214,6 @@ def wsgi_thread_task(
         test_func=wsgi_test,
         tasks_queue=tasks_queue,
         events_queue=events_queue,
-        generator_done=generator_done,
         checks=checks,
         targets=targets,
         data_generation_methods=data_generation_methods,
@@ -185,34 +229,36 @@ def wsgi_thread_task(
 def asgi_thread_task(
     tasks_queue: Queue,
     events_queue: Queue,
-    generator_done: threading.Event,
     checks: Iterable[CheckFunction],
     targets: Iterable[Target],
     data_generation_methods: Iterable[DataGenerationMethod],
     settings: hypothesis.settings,
     generation_config: GenerationConfig,
+    app: Any,
     headers: dict[str, Any] | None,
     ctx: RunnerContext,
     stateful: Stateful | None,
     stateful_recursion_limit: int,
     kwargs: Any,
 ) -> None:
-    _run_task(
-        test_func=asgi_test,
-        tasks_queue=tasks_queue,
-        events_queue=events_queue,
-        generator_done=generator_done,
-        checks=checks,
-        targets=targets,
-        data_generation_methods=data_generation_methods,
-        settings=settings,
-        generation_config=generation_config,
-        ctx=ctx,
-        stateful=stateful,
-        stateful_recursion_limit=stateful_recursion_limit,
-        headers=headers,
-        **kwargs,
-    )
+    # Every worker runs the app's lifespan once and reuses the client for all its requests
+    with get_asgi_session(app) as session:
+        _run_task(
+            test_func=asgi_test,
+            tasks_queue=tasks_queue,
+            events_queue=events_queue,
+            checks=checks,
+            targets=targets,
+            data_generation_methods=data_generation_methods,
+            settings=settings,
+            generation_config=generation_config,
+            ctx=ctx,
+            stateful=stateful,
+            stateful_recursion_limit=stateful_recursion_limit,
+            session=session,
+            headers=headers,
+            **kwargs,
+        )
 
 
 def stop_worker(thread_id: int) -> None:
@@ -230,71 +276,78 @@ class ThreadPoolRunner(BaseRunner):
         """All events come from a queue where different workers push their events."""
         # Instead of generating all tests at once, we do it when there is a free worker to pick it up
         # This is extremely important for memory consumption when testing large schemas
-        # IMPLEMENTATION NOTE:
-        # It would be better to have a separate producer thread and communicate via threading events.
-        # Though it is a bit more complex, so the current solution is suboptimal in terms of resources utilization,
-        # but good enough and easy enough to implement.
         tasks_generator = iter(self.schema.get_all_operations(generation_config=self.generation_config))
-        generator_done = threading.Event()
         tasks_queue: Queue = Queue()
-        # Add at least `workers_num` tasks first, so all workers are busy
-        for _ in range(self.workers_num):
+        is_generator_done = False
+
+        def schedule_next_task() -> None:
+            nonlocal is_generator_done
             try:
-                # SAFETY: Workers didn't start yet, direct modification is OK
-                tasks_queue.queue.append(next(tasks_generator))
+                tasks_queue.put(next(tasks_generator))
             except StopIteration:
-                generator_done.set()
+                is_generator_done = True
+                # Every worker takes exactly one marker and exits
+                for _ in range(self.workers_num):
+                    tasks_queue.put(NO_MORE_TASKS)
+
+        # Add at least `workers_num` tasks first, so all workers are busy
+        for _ in range(self.workers_num):
+            schedule_next_task()
+            if is_generator_done:
                 break
         # Events are pushed by workers via a separate queue
         events_queue: Queue = Queue()
-        workers = self._init_workers(tasks_queue, events_queue, ctx, generator_done)
+        workers = self._init_workers(tasks_queue, events_queue, ctx)
 
         def stop_workers() -> None:
             for worker in workers:
                 # workers are initialized at this point and `worker.ident` is set with an integer value
                 ident = cast(int, worker.ident)
                 stop_worker(ident)
+            # Workers waiting for a new task can't handle the exception until they are woken up
+            for _ in workers:
+                tasks_queue.put(NO_MORE_TASKS)
+            for worker in workers:
                 worker.join()
 
-        is_finished = False
+        running = len(workers)
         try:
-            while not is_finished:
-                # Sleep is needed for performance reasons
-                # each call to `is_alive` of an alive worker waits for a lock
-                # iterations without waiting are too frequent, and a lot of time will be spent on waiting for this locks
-                time.sleep(0.001)
-                is_finished = all(not worker.is_alive() for worker in workers)
-                while not events_queue.empty():
-                    event = events_queue.get()
-                    if ctx.is_stopped or isinstance(event, events.Interrupted) or self._should_stop(event):
-                        # We could still have events in the queue, but ignore them to keep the logic simple
-                        # for now, could be improved in the future to show more info in such corner cases
-                        stop_workers()
-                        is_finished = True
-                        if ctx.is_stopped:
-                            # Discard the event. The invariant is: the next event after `stream.stop()` is `Finished`
-                            break
+            while running:
+                # Workers always report when they are done, therefore waiting without a timeout is safe
+                event = events_queue.get()
+                if event is WORKER_FINISHED:
+                    running -= 1
+                    continue
+                if ctx.is_stopped or isinstance(event, events.Interrupted) or self._should_stop(event):
+                    stop_workers()
+                    if ctx.is_stopped:
+                        # Discard the event. The invariant is: the next event after `stream.stop()` is `Finished`
+                        break
                     yield event
-                    # When we know that there are more tasks, put another task to the queue.
-                    # The worker might not actually finish the current one yet, but we put the new one now, so
-                    # the worker can immediately pick it up when the current one is done
-                    if isinstance(event, events.BeforeExecution) and not generator_done.is_set():
-                        try:
-                            tasks_queue.put(next(tasks_generator))
-                        except StopIteration:
-                            generator_done.set()
+                    # Events that were emitted before workers stopped are still reported
+                    while not events_queue.empty():
+                        event = events_queue.get()
+                        if event is not WORKER_FINISHED:
+                            yield event
+                    break
+                yield event
+                # When we know that there are more tasks, put another task to the queue.
+                # The worker might not actually finish the current one yet, but we put the new one now, so
+                # the worker can immediately pick it up when the current one is done
+                if isinstance(event, events.BeforeExecution) and not is_generator_done:
+                    schedule_next_task()
+            for worker in workers:
+                worker.join()
         except KeyboardInterrupt:
             stop_workers()
             yield events.Interrupted()
 
-    def _init_workers(
-        self, tasks_queue: Queue, events_queue: Queue, ctx: RunnerContext, generator_done: threading.Event
-    ) -> list[threading.Thread]:
+    def _init_workers(self, tasks_queue: Queue, events_queue: Queue, ctx: RunnerContext) -> list[threading.Thread]:
         """Initialize & start workers that will execute tests."""
         workers = [
             threading.Thread(
                 target=self._get_task(),
-                kwargs=self._get_worker_kwargs(tasks_queue, events_queue, ctx, generator_done),
+                kwargs=self._get_worker_kwargs(tasks_queue, events_queue, ctx),
                 name=f"schemathesis_{num}",
             )
             for num in range(self.workers_num)
@@ -306,13 +359,10 @@ class ThreadPoolRunner(BaseRunner):
     def _get_task(self) -> Callable:
         return thread_task
 
-    def _get_worker_kwargs(
-        self, tasks_queue: Queue, events_queue: Queue, ctx: RunnerContext, generator_done: threading.Event
-    ) -> dict[str, Any]:
+    def _get_worker_kwargs(self, tasks_queue: Queue, events_queue: Queue, ctx: RunnerContext) -> dict[str, Any]:
         return {
             "tasks_queue": tasks_queue,
             "events_queue": events_queue,
-            "generator_done": generator_done,
             "checks": self.checks,
             "targets": self.targets,
             "settings": self.hypothesis_settings,
@@ -337,13 +387,10 @@ class ThreadPoolWSGIRunner(ThreadPoolRunner):
     def _get_task(self) -> Callable:
         return wsgi_thread_task
 
-    def _get_worker_kwargs(
-        self, tasks_queue: Queue, events_queue: Queue, ctx: RunnerContext, generator_done: threading.Event
-    ) -> dict[str, Any]:
+    def _get_worker_kwargs(self, tasks_queue: Queue, events_queue: Queue, ctx: RunnerContext) -> dict[str, Any]:
         return {
             "tasks_queue": tasks_queue,
             "events_queue": events_queue,
-            "generator_done": generator_done,
             "checks": self.checks,
             "targets": self.targets,
             "settings": self.hypothesis_settings,
@@ -367,17 +414,15 @@ class ThreadPoolASGIRunner(ThreadPoolRunner):
     def _get_task(self) -> Callable:
         return asgi_thread_task
 
-    def _get_worker_kwargs(
-        self, tasks_queue: Queue, events_queue: Queue, ctx: RunnerContext, generator_done: threading.Event
-    ) -> dict[str, Any]:
+    def _get_worker_kwargs(self, tasks_queue: Queue, events_queue: Queue, ctx: RunnerContext) -> dict[str, Any]:
         return {
             "tasks_queue": tasks_queue,
             "events_queue": events_queue,
-            "generator_done": generator_done,
             "checks": self.checks,
             "targets": self.targets,
             "settings": self.hypothesis_settings,
             "generation_config": self.generation_config,
+            "app": self.schema.app,
             "headers": self.headers,
             "ctx": ctx,
             "stateful": self.stateful,
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from ..constants import NOT_SET
+from ..exceptions import CheckFailed
+from ..types import NotSet
+
+
+@dataclass
+class OutcomeCacheStatistic:
+    """Summary of the outcome cache usage during a test run."""
+
+    size: int
+    capacity: int
+    hits: int
+    misses: int
+    evictions: int
+    # Approximate memory occupied by the cached outcomes, in bytes
+    memory_usage: int
+
+    __slots__ = ("size", "capacity", "hits", "misses", "evictions", "memory_usage")
+
+
+@dataclass
+class FailureRecord:
+    """A compact representation of a failed test outcome.
+
+    It does not reference the original exception, hence its traceback, frames, and chained exceptions are not kept
+    alive by the cache.
+    """
+
+    exc_type: type[BaseException]
+    args: tuple[Any, ...]
+    # Instance attributes of the original exception, e.g. `context` of `CheckFailed`
+    attributes: dict[str, Any]
+    causes: tuple[FailureRecord, ...] | None
+
+    __slots__ = ("exc_type", "args", "attributes", "causes")
+
+    @classmethod
+    def from_exception(cls, exc: BaseException) -> FailureRecord:
+        attributes = dict(getattr(exc, "__dict__", {}))
+        causes = None
+        if isinstance(exc, CheckFailed):
+            attributes.pop("causes", None)
+            if exc.causes:
+                causes = tuple(cls.from_exception(cause) for cause in exc.causes)
+        return cls(exc_type=exc.__class__, args=exc.args, attributes=attributes, causes=causes)
+
+    def to_exception(self) -> BaseException:
+        """Build a new exception instance from this record."""
+        # Skip `__init__` as custom exceptions may have arbitrary signatures
+        exc = self.exc_type.__new__(self.exc_type, *self.args)
+        exc.args = self.args
+        exc.__dict__.update(self.attributes)
+        if issubclass(self.exc_type, CheckFailed):
+            exc.causes = (  # type: ignore[attr-defined]
+                tuple(cause.to_exception() for cause in self.causes)  # type: ignore[misc]
+                if self.causes is not None
+                else None
+            )
+        return exc
+
+
+class OutcomeCache:
+    """A bounded cache of test outcomes with the least-recently-used eviction policy."""
+
+    __slots__ = ("capacity", "_entries", "_lock", "_hits", "_misses", "_evictions", "_merged")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._entries: OrderedDict[int, FailureRecord | None] = OrderedDict()
+        # The cache is shared between worker threads
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Statistic of caches from other processes participating in the same run
+        self._merged: list[OutcomeCacheStatistic] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: int) -> BaseException | None | NotSet:
+        """Get a cached outcome.
+
+        Every call returns a new exception instance, as raising it attaches a traceback to it.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return NOT_SET
+            self._hits += 1
+            self._entries.move_to_end(key)
+            record = self._entries[key]
+        if record is None:
+            return None
+        return record.to_exception()
+
+    def put(self, key: int, outcome: BaseException | None) -> None:
+        if self.capacity <= 0:
+            return
+        record = FailureRecord.from_exception(outcome) if outcome is not None else None
+        with self._lock:
+            self._entries[key] = record
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def memory_usage(self) -> int:
+        """Approximate size of the cache in bytes, including everything reachable from the stored records."""
+        with self._lock:
+            records = list(self._entries.values())
+            total = sys.getsizeof(self._entries)
+        seen: set[int] = set()
+        for record in records:
+            total += _deep_sizeof(record, seen)
+        return total
+
+    def merge_statistic(self, statistic: OutcomeCacheStatistic) -> None:
+        """Account for the usage of a cache from another process."""
+        with self._lock:
+            self._merged.append(statistic)
+
+    def get_statistic(self) -> OutcomeCacheStatistic:
+        memory_usage = self.memory_usage()
+        with self._lock:
+            merged = list(self._merged)
+            return OutcomeCacheStatistic(
+                size=len(self._entries) + sum(item.size for item in merged),
+                # Every process has its own cache
+                capacity=self.capacity * max(len(merged), 1),
+                hits=self._hits + sum(item.hits for item in merged),
+                misses=self._misses + sum(item.misses for item in merged),
+                evictions=self._evictions + sum(item.evictions for item in merged),
+                memory_usage=memory_usage + sum(item.memory_usage for item in merged),
+            )
+
+
+def _deep_sizeof(value: Any, seen: set[int]) -> int:
+    # Classes are shared and not owned by the cache
+    if isinstance(value, type) or id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_sizeof(key, seen) + _deep_sizeof(item, seen) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(item, seen) for item in value)
+    elif not isinstance(value, (str, bytes, int, float, bool)) and value is not None:
+        if hasattr(value, "__dict__"):
+            size += _deep_sizeof(value.__dict__, seen)
+        for cls in type(value).__mro__:
+            slots = getattr(cls, "__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name != "__dict__" and hasattr(value, name):
+                    size += _deep_sizeof(getattr(value, name), seen)
+    return size
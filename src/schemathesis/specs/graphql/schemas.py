@@ -27,7 +27,7 @@ from requests.structures import CaseInsensitiveDict
 
 from ... import auths
 from ...checks import not_a_server_error
-from ...constants import NOT_SET, SCHEMATHESIS_TEST_CASE_HEADER
+from ...constants import NOT_SET
 from ...exceptions import OperationNotFound, OperationSchemaError
 from ...generation import DataGenerationMethod, GenerationConfig
 from ...hooks import (
@@ -63,7 +63,8 @@ class RootType(enum.Enum):
 @dataclass(repr=False)
 class GraphQLCase(Case):
     def __hash__(self) -> int:
-        return hash(self.as_curl_command({SCHEMATHESIS_TEST_CASE_HEADER: "0"}))
+        # Explicit definition is needed, otherwise `dataclass` sets it to `None`
+        return super().__hash__()
 
     def _get_url(self, base_url: str | None) -> str:
         base_url = self._get_base_url(base_url)
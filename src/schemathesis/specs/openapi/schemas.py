@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from difflib import get_close_matches
 from hashlib import sha1
 from json import JSONDecodeError
-from threading import RLock
+from threading import RLock, local
 from types import SimpleNamespace
 from typing import (
     TYPE_CHECKING,
@@ -24,6 +24,7 @@ from typing import (
     cast,
 )
 from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
 
 import jsonschema
 from packaging import version
@@ -100,6 +101,9 @@ class BaseOpenAPISchema(BaseSchema):
     # Inline references cache can be populated from multiple threads, therefore we need some synchronisation to avoid
     # excessive resolving
     _inline_reference_cache_lock: RLock = field(default_factory=RLock)
+    # Response validators are compiled once per operation & response definition and then shared by all threads
+    _response_validators: WeakKeyDictionary = field(default_factory=WeakKeyDictionary)
+    _response_validators_lock: RLock = field(default_factory=RLock)
     component_locations: ClassVar[tuple[tuple[str, ...], ...]] = ()
 
     @property
@@ -651,14 +655,14 @@ class BaseOpenAPISchema(BaseSchema):
         responses = {str(key): value for key, value in operation.definition.raw.get("responses", {}).items()}
         status_code = str(response.status_code)
         if status_code in responses:
-            definition = responses[status_code]
+            key = status_code
         elif "default" in responses:
-            definition = responses["default"]
+            key = "default"
         else:
             # No response defined for the received response status code
             return None
-        scopes, schema = self.get_response_schema(definition, operation.definition.scope)
-        if not schema:
+        validator = self._get_response_validator(operation, key, responses[key])
+        if validator is None:
             # No schema to check against
             return None
         content_type = response.headers.get("Content-Type")
@@ -687,31 +691,52 @@ class BaseOpenAPISchema(BaseSchema):
             except Exception as exc:
                 errors.append(exc)
                 _maybe_raise_one_or_more(errors)
-        with self._validating_response(scopes) as resolver:
+        try:
+            validator.validate(data)
+        except jsonschema.ValidationError as exc:
+            exc_class = get_schema_validation_error(operation.verbose_name, exc)
+            ctx = failures.ValidationErrorContext.from_exception(exc, output_config=operation.schema.output_config)
             try:
-                jsonschema.validate(
-                    data,
-                    schema,
-                    cls=self.validator_cls,
-                    resolver=resolver,
-                    # Use a recent JSON Schema format checker to get most of formats checked for older drafts as well
-                    format_checker=jsonschema.Draft202012Validator.FORMAT_CHECKER,
-                )
-            except jsonschema.ValidationError as exc:
-                exc_class = get_schema_validation_error(operation.verbose_name, exc)
-                ctx = failures.ValidationErrorContext.from_exception(exc, output_config=operation.schema.output_config)
-                try:
-                    raise exc_class(ctx.title, context=ctx) from exc
-                except Exception as exc:
-                    errors.append(exc)
+                raise exc_class(ctx.title, context=ctx) from exc
+            except Exception as exc:
+                errors.append(exc)
         _maybe_raise_one_or_more(errors)
         return None  # explicitly return None for mypy
 
-    @contextmanager
-    def _validating_response(self, scopes: list[str]) -> Generator[ConvertingResolver, None, None]:
-        resolver = ConvertingResolver(
+    def _get_response_validator(
+        self, operation: APIOperation, key: str, definition: dict[str, Any]
+    ) -> ResponseValidator | None:
+        """Get a compiled validator for the response definition stored under `key` in the operation's `responses`."""
+        validator_cls = self.validator_cls
+        cache_key = (key, validator_cls)
+        validators = self._response_validators.get(operation)
+        if validators is not None and cache_key in validators:
+            return validators[cache_key]
+        with self._response_validators_lock:
+            validators = self._response_validators.setdefault(operation, {})
+            if cache_key not in validators:
+                scopes, schema = self.get_response_schema(definition, operation.definition.scope)
+                if schema:
+                    # Check the schema only once instead of doing it on every `jsonschema.validate` call
+                    validator_cls.check_schema(schema)
+                    validators[cache_key] = ResponseValidator(
+                        schema=schema,
+                        scopes=scopes,
+                        validator_cls=validator_cls,
+                        make_resolver=self._make_response_resolver,
+                    )
+                else:
+                    validators[cache_key] = None
+            return validators[cache_key]
+
+    def _make_response_resolver(self) -> ConvertingResolver:
+        return ConvertingResolver(
             self.location or "", self.raw_schema, nullable_name=self.nullable_name, is_response_schema=True
         )
+
+    @contextmanager
+    def _validating_response(self, scopes: list[str]) -> Generator[ConvertingResolver, None, None]:
+        resolver = self._make_response_resolver()
         with in_scopes(resolver, scopes):
             yield resolver
 
@@ -805,6 +830,42 @@ class BaseOpenAPISchema(BaseSchema):
         return schema
 
 
+@dataclass
+class ResponseValidator:
+    """A JSON Schema validator for a single response definition.
+
+    The resolver keeps a mutable stack of scopes while following references, therefore each thread gets its own
+    validator instance built from the same checked schema.
+    """
+
+    schema: dict[str, Any]
+    scopes: list[str]
+    validator_cls: type[jsonschema.Validator]
+    make_resolver: Callable[[], ConvertingResolver]
+    _local: local = field(default_factory=local)
+
+    def _get_validator(self) -> jsonschema.Validator:
+        validator = getattr(self._local, "validator", None)
+        if validator is None:
+            resolver = self.make_resolver()
+            for scope in self.scopes:
+                resolver.push_scope(scope)
+            validator = self.validator_cls(
+                self.schema,
+                resolver=resolver,
+                # Use a recent JSON Schema format checker to get most of formats checked for older drafts as well
+                format_checker=jsonschema.Draft202012Validator.FORMAT_CHECKER,
+            )
+            self._local.validator = validator
+        return validator
+
+    def validate(self, instance: Any) -> None:
+        """Raise the most relevant validation error, the same way as `jsonschema.validate` does."""
+        error = jsonschema.exceptions.best_match(self._get_validator().iter_errors(instance))
+        if error is not None:
+            raise error
+
+
 def _maybe_raise_one_or_more(errors: list[Exception]) -> None:
     if not errors:
         return
@@ -70,6 +70,8 @@ class StatefulTestRunnerConfig:
     dry_run: bool = False
     targets: list[Target] = field(default_factory=list)
     unique_data: bool = False
+    # Number of state machines executed concurrently
+    workers_num: int = 1
 
     def __post_init__(self) -> None:
         import hypothesis
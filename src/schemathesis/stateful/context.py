@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 import traceback
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Tuple, Type, Union
@@ -33,12 +34,28 @@ def _failure_cache_key(exc: CheckFailed | AssertionError) -> FailureKey:
 
 
 @dataclass
-class RunnerContext:
-    """Mutable context for state machine execution."""
+class SharedFailures:
+    """Failures shared by all workers executing the same state machine."""
 
     # All seen failure keys, both grouped and individual ones
     seen_in_run: set[FailureKey] = field(default_factory=set)
-    # Failures keys seen in the current suite
+    # Failure keys reported by any worker in its current suite
+    seen_in_suites: set[FailureKey] = field(default_factory=set)
+    # Total number of failures
+    count: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+@dataclass
+class RunnerContext:
+    """Mutable context for state machine execution.
+
+    Each worker has its own context, while failures are deduplicated across workers via `SharedFailures`.
+    """
+
+    # Failures seen by all workers
+    shared: SharedFailures = field(default_factory=SharedFailures)
+    # Failures keys reported by this worker in the current suite
     seen_in_suite: set[FailureKey] = field(default_factory=set)
     # Unique failures collected in the current suite
     failures_for_suite: list[Check] = field(default_factory=list)
@@ -48,14 +65,20 @@ class RunnerContext:
     current_step_status: events.StepStatus | None = None
     # The currently processed response
     current_response: GenericResponse | None = None
-    # Total number of failures
-    failures_count: int = 0
     # The total number of completed test scenario
     completed_scenarios: int = 0
     # Metrics collector for targeted testing
     metric_collector: TargetMetricCollector = field(default_factory=lambda: TargetMetricCollector(targets=[]))
     step_outcomes: dict[int, BaseException | None] = field(default_factory=dict)
 
+    @property
+    def seen_in_run(self) -> set[FailureKey]:
+        return self.shared.seen_in_run
+
+    @property
+    def failures_count(self) -> int:
+        return self.shared.count
+
     @property
     def current_scenario_status(self) -> events.ScenarioStatus:
         if self.current_step_status == events.StepStatus.SUCCESS:
@@ -90,31 +113,42 @@ class RunnerContext:
         self.current_step_status = events.StepStatus.INTERRUPTED
 
     def mark_as_seen_in_run(self, exc: CheckFailed) -> None:
-        key = _failure_cache_key(exc)
-        self.seen_in_run.add(key)
+        keys = [_failure_cache_key(exc)]
         causes = exc.causes or ()
         for cause in causes:
-            key = _failure_cache_key(cause)
-            self.seen_in_run.add(key)
+            keys.append(_failure_cache_key(cause))
+        with self.shared.lock:
+            self.shared.seen_in_run.update(keys)
+
+    def mark_as_seen_in_suite(self, exc: CheckFailed | AssertionError) -> bool:
+        """Mark the failure as seen in the current suite.
 
-    def mark_as_seen_in_suite(self, exc: CheckFailed | AssertionError) -> None:
+        Returns `False` if this or any other worker has already reported it.
+        """
         key = _failure_cache_key(exc)
+        with self.shared.lock:
+            if key in self.shared.seen_in_suites or key in self.shared.seen_in_run:
+                return False
+            self.shared.seen_in_suites.add(key)
         self.seen_in_suite.add(key)
+        return True
 
     def mark_current_suite_as_seen_in_run(self) -> None:
-        self.seen_in_run.update(self.seen_in_suite)
+        with self.shared.lock:
+            self.shared.seen_in_run.update(self.seen_in_suite)
 
     def is_seen_in_run(self, exc: CheckFailed | AssertionError) -> bool:
         key = _failure_cache_key(exc)
-        return key in self.seen_in_run
+        return key in self.shared.seen_in_run
 
     def is_seen_in_suite(self, exc: CheckFailed | AssertionError) -> bool:
         key = _failure_cache_key(exc)
-        return key in self.seen_in_suite
+        return key in self.shared.seen_in_suites
 
     def add_failed_check(self, check: Check) -> None:
         self.failures_for_suite.append(check)
-        self.failures_count += 1
+        with self.shared.lock:
+            self.shared.count += 1
 
     def collect_metric(self, case: Case, response: GenericResponse) -> None:
         self.metric_collector.store(case, response)
@@ -124,6 +158,9 @@ class RunnerContext:
 
     def reset(self) -> None:
         self.failures_for_suite = []
+        with self.shared.lock:
+            # Failures that are not marked as seen in the run may be reported again in the next suite
+            self.shared.seen_in_suites.difference_update(self.seen_in_suite)
         self.seen_in_suite.clear()
         self.reset_scenario()
         self.metric_collector.reset()
@@ -16,7 +16,7 @@ from ..internal.checks import CheckContext
 from ..targets import TargetMetricCollector
 from . import events
 from .config import StatefulTestRunnerConfig
-from .context import RunnerContext
+from .context import RunnerContext, SharedFailures
 from .validation import validate_response
 
 if TYPE_CHECKING:
@@ -27,6 +27,13 @@ if TYPE_CHECKING:
     from .state_machine import APIStateMachine, Direction, StepResult
 
 EVENT_QUEUE_TIMEOUT = 0.01
+# Before running the first scenario, Hypothesis parses the state machine source via `ast`, which is not thread-safe
+# in CPython 3.11 and may fail with `SystemError`. Therefore, workers start their suites one at a time
+_SUITE_START_LOCK = threading.Lock()
+
+
+class _AlreadyPassed(Exception):
+    """The same step has already passed during this run."""
 
 
 @dataclass
@@ -34,7 +41,9 @@ class StatefulTestRunner:
     """Stateful test runner for the given state machine.
 
     By default, the test runner executes the state machine in a loop until there are no new failures are found.
-    The loop is executed in a separate thread for better control over the execution and reporting.
+    The loop is executed in a separate thread for better control over the execution and reporting. With multiple
+    workers, each of them runs its own loop with a separate session and seed, and failures are deduplicated across
+    all of them.
     """
 
     # State machine class to use
@@ -52,18 +61,26 @@ class StatefulTestRunner:
 
         yield events.RunStarted(state_machine=self.state_machine)
 
-        runner_thread = threading.Thread(
-            target=_execute_state_machine_loop,
-            kwargs={
-                "state_machine": self.state_machine,
-                "event_queue": self.event_queue,
-                "config": self.config,
-                "stop_event": self.stop_event,
-            },
-        )
+        shared = SharedFailures()
+        finished_event = threading.Event()
+        runner_threads = [
+            threading.Thread(
+                target=_execute_state_machine_loop,
+                kwargs={
+                    "state_machine": self.state_machine,
+                    "event_queue": self.event_queue,
+                    "config": self.config,
+                    "stop_event": self.stop_event,
+                    "finished_event": finished_event,
+                    "shared": shared,
+                    "worker_id": worker_id,
+                },
+            )
+            for worker_id in range(self.config.workers_num)
+        ]
         run_status = events.RunStatus.SUCCESS
 
-        with thread_manager(runner_thread):
+        with thread_manager(*runner_threads):
             try:
                 while True:
                     try:
@@ -79,7 +96,7 @@ class StatefulTestRunner:
                                 run_status = events.RunStatus.INTERRUPTED
                         yield event
                     except queue.Empty:
-                        if not runner_thread.is_alive():
+                        if not any(thread.is_alive() for thread in runner_threads):
                             break
             except KeyboardInterrupt:
                 # Immediately notify the runner thread to stop, even though that the event will be set below in `finally`
@@ -97,12 +114,14 @@ class StatefulTestRunner:
 
 
 @contextmanager
-def thread_manager(thread: threading.Thread) -> Generator[None, None, None]:
-    thread.start()
+def thread_manager(*threads: threading.Thread) -> Generator[None, None, None]:
+    for thread in threads:
+        thread.start()
     try:
         yield
     finally:
-        thread.join()
+        for thread in threads:
+            thread.join()
 
 
 def _execute_state_machine_loop(
@@ -111,14 +130,26 @@ def _execute_state_machine_loop(
     event_queue: queue.Queue,
     config: StatefulTestRunnerConfig,
     stop_event: threading.Event,
+    finished_event: threading.Event | None = None,
+    shared: SharedFailures | None = None,
+    worker_id: int = 0,
 ) -> None:
-    """Execute the state machine testing loop."""
+    """Execute the state machine testing loop.
+
+    `finished_event` is set when this worker decides that the whole run should stop, e.g. on the first failure with
+    `exit_first`, so other workers finish their current suites early.
+    """
     from hypothesis import reporting
     from requests.structures import CaseInsensitiveDict
 
     from ..transports import RequestsTransport
 
-    ctx = RunnerContext(metric_collector=TargetMetricCollector(targets=config.targets))
+    if finished_event is None:
+        finished_event = threading.Event()
+    ctx = RunnerContext(
+        shared=shared if shared is not None else SharedFailures(),
+        metric_collector=TargetMetricCollector(targets=config.targets),
+    )
 
     call_kwargs: dict[str, Any] = {"headers": config.headers}
     if isinstance(state_machine.schema.transport, RequestsTransport):
@@ -133,10 +164,19 @@ def _execute_state_machine_loop(
         call_kwargs["session"] = session
     check_ctx = CheckContext(auth=config.auth, headers=CaseInsensitiveDict(config.headers) if config.headers else None)
 
+    holds_start_lock = False
+
+    def release_start_lock() -> None:
+        nonlocal holds_start_lock
+        if holds_start_lock:
+            holds_start_lock = False
+            _SUITE_START_LOCK.release()
+
     class _InstrumentedStateMachine(state_machine):  # type: ignore[valid-type,misc]
         """State machine with additional hooks for emitting events."""
 
         def setup(self) -> None:
+            release_start_lock()
             build_ctx = current_build_context()
             event_queue.put(events.ScenarioStarted(is_final=build_ctx.is_final))
             super().setup()
@@ -147,33 +187,36 @@ def _execute_state_machine_loop(
         def _repr_step(self, rule: Rule, data: dict, result: StepResult) -> str:
             return ""
 
-        if config.override is not None:
-
-            def before_call(self, case: Case) -> None:
-                for location, entry in config.override.for_operation(case.operation).items():  # type: ignore[union-attr]
+        def before_call(self, case: Case) -> None:
+            if config.override is not None:
+                for location, entry in config.override.for_operation(case.operation).items():
                     if entry:
                         container = getattr(case, location) or {}
                         container.update(entry)
                         setattr(case, location, container)
-                return super().before_call(case)
+            super().before_call(case)
+            if config.unique_data:
+                # Look up the outcome only when the case is final, i.e. after the link & hook modifications
+                case._fingerprint = None
+                cached = ctx.get_step_outcome(case)
+                if isinstance(cached, BaseException):
+                    raise cached
+                elif cached is None:
+                    raise _AlreadyPassed
 
         def step(self, case: Case, previous: tuple[StepResult, Direction] | None = None) -> StepResult | None:
             # Checking the stop event once inside `step` is sufficient as it is called frequently
             # The idea is to stop the execution as soon as possible
-            if stop_event.is_set():
+            if stop_event.is_set() or finished_event.is_set():
                 raise KeyboardInterrupt
             event_queue.put(events.StepStarted())
             try:
                 if config.dry_run:
                     return None
-                if config.unique_data:
-                    cached = ctx.get_step_outcome(case)
-                    if isinstance(cached, BaseException):
-                        raise cached
-                    elif cached is None:
-                        return None
                 result = super().step(case, previous)
                 ctx.step_succeeded()
+            except _AlreadyPassed:
+                return None
             except CheckFailed as exc:
                 if config.unique_data:
                     ctx.store_step_outcome(case, exc)
@@ -246,7 +289,8 @@ def _execute_state_machine_loop(
             super().teardown()
 
     if config.seed is not None:
-        InstrumentedStateMachine = hypothesis.seed(config.seed)(_InstrumentedStateMachine)
+        # Every worker explores a different sequence of scenarios
+        InstrumentedStateMachine = hypothesis.seed(config.seed + worker_id)(_InstrumentedStateMachine)
     else:
         InstrumentedStateMachine = _InstrumentedStateMachine
 
@@ -255,6 +299,9 @@ def _execute_state_machine_loop(
 
     while True:
         # This loop is running until no new failures are found in a single iteration
+        if finished_event.is_set():
+            # Another worker has stopped the run
+            break
         event_queue.put(events.SuiteStarted())
         if stop_event.is_set():
             event_queue.put(events.SuiteFinished(status=events.SuiteStatus.INTERRUPTED, failures=[]))
@@ -262,8 +309,18 @@ def _execute_state_machine_loop(
         suite_status = events.SuiteStatus.SUCCESS
         try:
             with reporting.with_reporter(lambda _: None):  # type: ignore
-                InstrumentedStateMachine.run(settings=config.hypothesis_settings)
+                _SUITE_START_LOCK.acquire()
+                holds_start_lock = True
+                try:
+                    InstrumentedStateMachine.run(settings=config.hypothesis_settings)
+                finally:
+                    release_start_lock()
         except KeyboardInterrupt:
+            if finished_event.is_set() and not stop_event.is_set():
+                # Another worker has stopped the run, keep failures found so far
+                if ctx.failures_for_suite:
+                    suite_status = events.SuiteStatus.FAILURE
+                break
             # Raised in the state machine when the stop event is set or it is raised by the user's code
             # that is placed in the base class of the state machine.
             # Therefore, set the stop event to cover the latter case
@@ -276,12 +333,14 @@ def _execute_state_machine_loop(
             # Here we need to either exit or re-run the state machine with this failure marked as known
             suite_status = events.SuiteStatus.FAILURE
             if should_stop():
+                finished_event.set()
                 break
             ctx.mark_as_seen_in_run(exc)
             continue
         except Flaky:
             suite_status = events.SuiteStatus.FAILURE
             if should_stop():
+                finished_event.set()
                 break
             # Mark all failures in this suite as seen to prevent them being re-discovered
             ctx.mark_current_suite_as_seen_in_run()
@@ -297,6 +356,7 @@ def _execute_state_machine_loop(
             # Any other exception is an inner error and the test run should be stopped
             suite_status = events.SuiteStatus.ERROR
             event_queue.put(events.Errored(exception=exc))
+            finished_event.set()
             break
         finally:
             event_queue.put(events.SuiteFinished(status=suite_status, failures=ctx.failures_for_suite))
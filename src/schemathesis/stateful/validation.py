@@ -34,7 +34,7 @@ def validate_response(
 
     def _on_failure(exc: CheckFailed | AssertionError, message: str, context: FailureContext | None) -> None:
         exceptions.append(exc)
-        if runner_ctx.is_seen_in_suite(exc):
+        if not runner_ctx.mark_as_seen_in_suite(exc):
             return
         failed_check = Check(
             name=name,
@@ -48,7 +48,6 @@ def validate_response(
         )
         runner_ctx.add_failed_check(failed_check)
         check_results.append(failed_check)
-        runner_ctx.mark_as_seen_in_suite(exc)
 
     def _on_passed(_name: str, _case: Case) -> None:
         passed_check = Check(
@@ -254,6 +254,11 @@ class ASGITransport(RequestsTransport):
 
         if base_url is None:
             base_url = case.get_full_base_url()
+        if isinstance(session, ASGIClient):
+            # A long-lived client with the app's lifespan already running
+            return super().send(
+                case, session=session, base_url=base_url, headers=headers, params=params, cookies=cookies, **kwargs
+            )
         with ASGIClient(self.app) as client:
             return super().send(
                 case, session=client, base_url=base_url, headers=headers, params=params, cookies=cookies, **kwargs
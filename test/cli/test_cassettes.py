@@ -3,8 +3,9 @@ import io
 import json
 import platform
 import re
+import sys
 import threading
-from unittest.mock import ANY
+from unittest.mock import ANY, patch
 from urllib.parse import parse_qsl, quote_plus, unquote_plus, urlencode, urlparse, urlunparse
 from uuid import UUID
 
@@ -17,13 +18,25 @@ from hypothesis import example, given
 from hypothesis import strategies as st
 from urllib3._collections import HTTPHeaderDict
 
-from schemathesis.cli import DEPRECATED_CASSETTE_PATH_OPTION_WARNING
+from schemathesis.cli import DEPRECATED_CASSETTE_PATH_OPTION_WARNING, cassettes
 from schemathesis.cli.cassettes import (
+    COMPACT_MAGIC,
+    COMPACT_UINT32,
+    COMPACT_VERSION,
     CassetteFormat,
+    CassetteIndex,
+    IndexEntry,
     _cookie_to_har,
+    count_interactions,
+    detect_cassette_format,
     filter_cassette,
+    filter_index,
+    get_index_path,
     get_command_representation,
     get_prepared_request,
+    iter_har_entries,
+    iter_indexed_interactions,
+    iter_interactions,
     write_double_quoted,
 )
 from schemathesis.cli.reporting import TEST_CASE_ID_TITLE
@@ -402,6 +415,216 @@ def test_har_format_dry_run(cli, schema_url, cassette_path, hypothesis_max_examp
     assert data["log"]["entries"][0]["response"]["status"] == 0
 
 
+@pytest.mark.operations("__all__")
+@pytest.mark.parametrize("args", ((), ("--cassette-preserve-exact-body-bytes",)), ids=("plain", "base64"))
+def test_iter_vcr_interactions(cli, schema_url, cassette_path, args):
+    cli.run(
+        schema_url,
+        f"--cassette-path={cassette_path}",
+        "--hypothesis-max-examples=1",
+        "--hypothesis-seed=1",
+        "--validate-schema=false",
+        *args,
+    )
+    expected = load_cassette(cassette_path)["http_interactions"]
+    # When interactions are read one by one
+    with cassette_path.open("rb") as fd:
+        assert count_interactions(fd) == len(expected)
+        interactions = list(iter_interactions(fd))
+    # Then they are the same as if the whole cassette was loaded at once
+    assert interactions == expected
+
+
+@pytest.mark.operations("__all__")
+def test_iter_har_entries(cli, schema_url, cassette_path, mocker):
+    cassette_path = cassette_path.with_suffix(".har")
+    cli.run(
+        schema_url,
+        f"--cassette-path={cassette_path}",
+        "--cassette-format=har",
+        "--hypothesis-max-examples=1",
+        "--hypothesis-seed=1",
+        "--validate-schema=false",
+    )
+    with cassette_path.open(encoding="utf-8") as fd:
+        expected = json.load(fd)["log"]["entries"]
+    # When entries are split between many chunks
+    mocker.patch("schemathesis.cli.cassettes.HAR_READ_CHUNK_SIZE", 16)
+    with cassette_path.open("rb") as fd:
+        assert count_interactions(fd) == len(expected)
+        entries = list(iter_har_entries(fd))
+    # Then they are decoded the same way as the whole file
+    assert entries == expected
+
+
+def test_iter_har_entries_empty():
+    fd = io.BytesIO(json.dumps({"log": {"version": "1.2", "entries": []}}).encode())
+    assert list(iter_interactions(fd)) == []
+
+
+@pytest.mark.operations("success", "flaky", "text", "failure", "multiple_failures")
+@pytest.mark.openapi_version("3.0")
+def test_replay_workers(cli, schema_url, cassette_path):
+    cli.run(
+        schema_url,
+        f"--cassette-path={cassette_path}",
+        "--hypothesis-max-examples=5",
+        "--hypothesis-seed=1",
+        "--validate-schema=false",
+    )
+    # When interactions are replayed concurrently
+    sequential = cli.replay(str(cassette_path))
+    concurrent = cli.replay(str(cassette_path), "--workers=4")
+    assert concurrent.exit_code == ExitCode.OK, concurrent.stdout
+    # Then they are displayed in the same order as in the cassette
+    expected_ids = [item["id"] for item in load_cassette(cassette_path)["http_interactions"]]
+    assert re.findall(r"ID\s+: (\d+)", concurrent.stdout) == expected_ids
+    assert re.findall(r"ID\s+: (\d+)", sequential.stdout) == expected_ids
+
+
+@pytest.mark.operations("success", "text")
+@pytest.mark.openapi_version("3.0")
+def test_replay_har(cli, schema_url, cassette_path):
+    cassette_path = cassette_path.with_suffix(".har")
+    cli.run(
+        schema_url,
+        f"--cassette-path={cassette_path}",
+        "--cassette-format=har",
+        "--hypothesis-max-examples=1",
+        "--hypothesis-seed=1",
+        "--validate-schema=false",
+    )
+    with cassette_path.open(encoding="utf-8") as fd:
+        entries = json.load(fd)["log"]["entries"]
+    # When a HAR cassette is replayed
+    result = cli.replay(str(cassette_path), "-v")
+    # Then all its entries are sent again
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert f"Total interactions: {len(entries)}" in result.stdout
+    assert result.stdout.count("New status code : 200") == len(entries)
+
+
+@pytest.fixture
+def compact_cassette(cli, schema_url, tmp_path):
+    path = tmp_path / "output.bin"
+    with patch("schemathesis.cli.cassettes.get_command_representation", return_value="st run original"):
+        result = cli.run(
+            schema_url,
+            f"--cassette-path={path}",
+            "--cassette-format=compact",
+            "--hypothesis-max-examples=3",
+            "--hypothesis-seed=1",
+            "--validate-schema=false",
+        )
+    assert path.exists(), result.stdout
+    return path
+
+
+def decode_body(body):
+    if "base64_string" in body:
+        return base64.b64decode(body["base64_string"])
+    return body["string"].encode(body["encoding"])
+
+
+@pytest.mark.operations("success", "failure", "text", "payload", "empty")
+@pytest.mark.openapi_version("3.0")
+def test_compact_to_vcr(cli, compact_cassette, tmp_path):
+    with compact_cassette.open("rb") as fd:
+        assert detect_cassette_format(fd) == CassetteFormat.COMPACT
+        expected = list(iter_interactions(fd))
+    assert expected
+    output = tmp_path / "converted.yaml"
+    # When a compact cassette is converted to VCR
+    result = cli.main("convert-cassette", str(compact_cassette), str(output), "--preserve-exact-body-bytes")
+    assert result.exit_code == ExitCode.OK, result.stdout
+    cassette = load_cassette(output)
+    # Then all interactions are preserved
+    # The original command is kept
+    assert cassette["command"] == "st run original"
+    interactions = cassette["http_interactions"]
+    assert len(interactions) == len(expected)
+    for converted, original in zip(interactions, expected):
+        for key in ("id", "status", "seed", "thread_id", "data_generation_method", "phase", "checks", "recorded_at"):
+            assert converted[key] == original[key], key
+        assert converted["request"]["uri"] == original["request"]["uri"]
+        assert converted["request"]["method"] == original["request"]["method"]
+        assert converted["request"]["headers"] == original["request"]["headers"]
+        assert converted["response"]["status"] == original["response"]["status"]
+        assert converted["response"]["headers"] == original["response"]["headers"]
+        for part in ("request", "response"):
+            assert ("body" in converted[part]) is ("body" in original[part])
+            if "body" in original[part]:
+                assert decode_body(converted[part]["body"]) == decode_body(original[part]["body"])
+
+
+@pytest.mark.operations("success", "text")
+@pytest.mark.openapi_version("3.0")
+def test_compact_to_har(cli, compact_cassette, tmp_path):
+    with compact_cassette.open("rb") as fd:
+        expected = list(iter_interactions(fd))
+    output = tmp_path / "converted.har"
+    # When a compact cassette is converted to HAR
+    result = cli.main("convert-cassette", str(compact_cassette), str(output), "--format=har")
+    assert result.exit_code == ExitCode.OK, result.stdout
+    # Then all interactions are there
+    with output.open(encoding="utf-8") as fd:
+        entries = json.load(fd)["log"]["entries"]
+    assert [entry["request"]["url"] for entry in entries] == [item["request"]["uri"] for item in expected]
+
+
+@pytest.mark.operations("success", "text")
+@pytest.mark.openapi_version("3.0")
+def test_replay_compact(cli, compact_cassette):
+    with compact_cassette.open("rb") as fd:
+        total = count_interactions(fd)
+    # When a compact cassette is replayed
+    result = cli.replay(str(compact_cassette), "-v")
+    # Then all its interactions are sent again
+    assert result.exit_code == ExitCode.OK, result.stdout
+    assert f"Total interactions: {total}" in result.stdout
+    assert result.stdout.count("New status code : 200") == total
+
+
+@pytest.mark.operations("success", "text")
+@pytest.mark.openapi_version("3.0")
+def test_compact_multiple_blocks(cli, schema_url, tmp_path, mocker):
+    # When every record is written in its own block
+    mocker.patch("schemathesis.cli.cassettes.COMPACT_BLOCK_SIZE", 1)
+    path = tmp_path / "output.bin"
+    cli.run(
+        schema_url,
+        f"--cassette-path={path}",
+        "--cassette-format=compact",
+        "--hypothesis-max-examples=3",
+        "--hypothesis-seed=1",
+        "--validate-schema=false",
+    )
+    # Then all blocks are read
+    with path.open("rb") as fd:
+        total = count_interactions(fd)
+        interactions = list(iter_interactions(fd))
+    assert total > 1
+    assert [item["id"] for item in interactions] == [str(idx) for idx in range(1, total + 1)]
+
+
+def test_compact_zstd_not_installed(cli, tmp_path, monkeypatch):
+    header = json.dumps({"command": "st run", "recorded_with": "", "seed": None, "compression": "zstd"}).encode()
+    path = tmp_path / "output.bin"
+    path.write_bytes(COMPACT_MAGIC + bytes((COMPACT_VERSION,)) + COMPACT_UINT32.pack(len(header)) + header)
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+    result = cli.main("convert-cassette", str(path), str(tmp_path / "converted.yaml"))
+    assert result.exit_code == 2, result.stdout
+    assert "Install the `zstandard` package" in result.stdout
+
+
+def test_convert_non_compact(cli, tmp_path):
+    path = tmp_path / "output.yaml"
+    path.write_text("http_interactions: []")
+    result = cli.main("convert-cassette", str(path), str(tmp_path / "converted.yaml"))
+    assert result.exit_code == 2, result.stdout
+    assert "Only cassettes in the compact format can be converted" in result.stdout
+
+
 def test_invalid_format():
     with pytest.raises(ValueError, match="Invalid value for cassette format: invalid. Available formats: vcr, har"):
         CassetteFormat.from_str("invalid")
@@ -557,20 +780,20 @@ def test_empty_body():
     assert request.body is None
 
 
-@pytest.mark.parametrize(
-    "filters, expected",
-    (
-        ({"id_": "1"}, ["1"]),
-        ({"id_": "2"}, ["2"]),
-        ({"status": "SUCCESS"}, ["1"]),
-        ({"status": "success"}, ["1"]),
-        ({"status": "ERROR"}, ["2"]),
-        ({"uri": "succe.*"}, ["1"]),
-        ({"method": "PO"}, ["2"]),
-        ({"uri": "error|failure"}, ["2", "3"]),
-        ({"uri": "error|failure", "method": "POST"}, ["2"]),
-    ),
+FILTER_CASES = (
+    ({"id_": "1"}, ["1"]),
+    ({"id_": "2"}, ["2"]),
+    ({"status": "SUCCESS"}, ["1"]),
+    ({"status": "success"}, ["1"]),
+    ({"status": "ERROR"}, ["2"]),
+    ({"uri": "succe.*"}, ["1"]),
+    ({"method": "PO"}, ["2"]),
+    ({"uri": "error|failure"}, ["2", "3"]),
+    ({"uri": "error|failure", "method": "POST"}, ["2"]),
 )
+
+
+@pytest.mark.parametrize("filters, expected", FILTER_CASES)
 def test_filter_cassette(filters, expected):
     cassette = [
         {"id": "1", "status": "SUCCESS", "request": {"uri": "http://127.0.0.1/api/success", "method": "GET"}},
@@ -580,6 +803,33 @@ def test_filter_cassette(filters, expected):
     assert list(filter_cassette(cassette, **filters)) == [item for item in cassette if item["id"] in expected]
 
 
+@pytest.mark.parametrize("filters, expected", FILTER_CASES)
+def test_filter_index(filters, expected):
+    entries = [
+        IndexEntry(0, 10, "1", "SUCCESS", "GET", "http://127.0.0.1/api/success", "GET /success"),
+        IndexEntry(10, 10, "2", "ERROR", "POST", "http://127.0.0.1/api/error", "POST /error"),
+        IndexEntry(20, 10, "3", "FAILURE", "PUT", "http://127.0.0.1/api/failure", "PUT /failure"),
+    ]
+    assert list(filter_index(entries, **filters)) == [entry for entry in entries if entry.id in expected]
+
+
+@pytest.mark.parametrize(
+    "uri, operation",
+    (
+        ("http://127.0.0.1/api/success", "GET /success"),
+        ("http://127.0.0.1/api/\tsuccess", "GET /\tsuc\ncess"),
+    ),
+)
+def test_index_entry_serialization(uri, operation):
+    entry = IndexEntry(42, 100, "1", "SUCCESS", "GET", uri, operation)
+    loaded = IndexEntry.deserialize(entry.serialize() + "\n")
+    assert loaded.offset == 42
+    assert loaded.length == 100
+    assert loaded.uri == uri
+    # Line breaks are replaced, so every entry occupies exactly one line
+    assert "\n" not in loaded.operation
+
+
 @pytest.mark.operations("success")
 @pytest.mark.openapi_version("3.0")
 def test_use_deprecation(cli, schema_url, cassette_path):
@@ -604,6 +854,93 @@ def test_forbid_simultaneous_use_of_deprecated_and_new_options(cli, schema_url,
     )
 
 
+@pytest.mark.operations("success", "flaky", "text", "failure", "multiple_failures")
+@pytest.mark.openapi_version("3.0")
+def test_cassette_index(cli, schema_url, cassette_path):
+    # When the index is requested
+    cli.run(
+        schema_url,
+        f"--cassette-path={cassette_path}",
+        "--cassette-index",
+        "--hypothesis-max-examples=3",
+        "--hypothesis-seed=1",
+        "--validate-schema=false",
+    )
+    expected = load_cassette(cassette_path)["http_interactions"]
+    index = CassetteIndex.load(str(cassette_path))
+    # Then it points to every interaction in the cassette
+    assert index is not None
+    assert index.interactions_count == len(expected)
+    entries = list(index.iter_entries())
+    assert [(entry.id, entry.status, entry.method, entry.uri) for entry in entries] == [
+        (item["id"], item["status"], item["request"]["method"], item["request"]["uri"]) for item in expected
+    ]
+    assert {entry.operation for entry in entries} >= {"GET /api/success", "GET /api/failure"}
+    with cassette_path.open("rb") as fd:
+        assert list(iter_indexed_interactions(fd, entries)) == expected
+
+
+@pytest.mark.operations("success", "failure")
+@pytest.mark.openapi_version("3.0")
+def test_replay_with_index(cli, schema_url, cassette_path, mocker):
+    cli.run(
+        schema_url,
+        f"--cassette-path={cassette_path}",
+        "--cassette-index",
+        "--hypothesis-max-examples=1",
+        "--hypothesis-seed=1",
+        "--validate-schema=false",
+    )
+    expected = [item for item in load_cassette(cassette_path)["http_interactions"] if item["status"] == "FAILURE"]
+    spy = mocker.spy(cassettes, "iter_interactions")
+    # When a cassette with an index is replayed
+    result = cli.replay(str(cassette_path), "--status=failure")
+    assert result.exit_code == ExitCode.OK, result.stdout
+    # Then the cassette is not scanned
+    spy.assert_not_called()
+    assert re.findall(r"ID\s+: (\d+)", result.stdout) == [item["id"] for item in expected]
+
+
+@pytest.mark.operations("success")
+@pytest.mark.openapi_version("3.0")
+def test_stale_index(cli, schema_url, cassette_path):
+    cli.run(
+        schema_url,
+        f"--cassette-path={cassette_path}",
+        "--cassette-index",
+        "--hypothesis-max-examples=1",
+        "--validate-schema=false",
+    )
+    # When the cassette is modified after the index was written
+    with cassette_path.open("a", encoding="utf-8") as fd:
+        fd.write("\n")
+    # Then the index is ignored
+    assert CassetteIndex.load(str(cassette_path)) is None
+    result = cli.replay(str(cassette_path))
+    assert result.exit_code == ExitCode.OK, result.stdout
+
+
+def test_missing_index(cassette_path):
+    cassette_path.write_text("http_interactions: []")
+    assert CassetteIndex.load(str(cassette_path)) is None
+    with open(get_index_path(str(cassette_path)), "w") as fd:
+        fd.write("unknown")
+    assert CassetteIndex.load(str(cassette_path)) is None
+
+
+@pytest.mark.openapi_version("3.0")
+def test_forbid_cassette_index_without_cassette_path(cli, schema_url, snapshot_cli):
+    assert cli.run(schema_url, "--cassette-index") == snapshot_cli
+
+
+@pytest.mark.openapi_version("3.0")
+def test_forbid_cassette_index_for_har(cli, schema_url, cassette_path, snapshot_cli):
+    assert (
+        cli.run(schema_url, f"--cassette-path={cassette_path}", "--cassette-format=har", "--cassette-index")
+        == snapshot_cli
+    )
+
+
 @pytest.mark.openapi_version("3.0")
 def test_forbid_preserve_exact_bytes_without_cassette_path(cli, schema_url, snapshot_cli):
     # When `--cassette-preserve-exact-body-bytes` is specified without `--cassette-path`
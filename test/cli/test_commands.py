@@ -4,7 +4,9 @@ import os
 import pathlib
 import platform
 import sys
+import threading
 import time
+from queue import Queue
 from unittest.mock import ANY
 from urllib.parse import urljoin
 from xml.etree import ElementTree
@@ -35,6 +37,7 @@ from schemathesis.code_samples import CodeSampleStyle
 from schemathesis.constants import (
     DEFAULT_DEADLINE,
     DEFAULT_RESPONSE_TIMEOUT,
+    DEFAULT_UNIQUE_DATA_CACHE_SIZE,
     FLAKY_FAILURE_MESSAGE,
     REPORT_SUGGESTION_ENV_VAR,
 )
@@ -247,6 +250,8 @@ SCHEMA_URI = "https://example.schemathesis.io/openapi.json"
         ([], {}),
         (["--exitfirst"], {"exit_first": True}),
         (["--workers=2"], {"workers_num": 2}),
+        (["--workers=2", "--workers-mode=asyncio"], {"workers_num": 2, "workers_mode": "asyncio"}),
+        (["--workers=2", "--workers-mode=processes"], {"workers_num": 2, "workers_mode": "processes"}),
         (["--hypothesis-seed=123"], {"seed": 123}),
         (
             [
@@ -293,6 +298,7 @@ def test_from_schema_arguments(cli, mocker, swagger_20, args, expected):
         "checks": DEFAULT_CHECKS,
         "targets": DEFAULT_TARGETS,
         "workers_num": 1,
+        "workers_mode": "threads",
         "exit_first": False,
         "max_failures": None,
         "started_at": ANY,
@@ -310,6 +316,7 @@ def test_from_schema_arguments(cli, mocker, swagger_20, args, expected):
         "store_interactions": False,
         "seed": None,
         "unique_data": False,
+        "unique_data_cache_size": DEFAULT_UNIQUE_DATA_CACHE_SIZE,
         "max_response_time": None,
         "generation_config": GenerationConfig(),
         "probe_config": ProbeConfig(auth_type="basic", headers={}, request=RequestConfig(timeout=10000)),
@@ -1064,17 +1071,19 @@ def test_keyboard_interrupt(cli, cli_args, base_url, mocker, flask_app, swagger_
 @pytest.mark.filterwarnings("ignore:Exception in thread")
 def test_keyboard_interrupt_threaded(cli, cli_args, mocker):
     # When a Schemathesis run is interrupted by the keyboard or via SIGINT
-    original = time.sleep
     counter = 0
 
-    def mocked(*args, **kwargs):
-        nonlocal counter
-        counter += 1
-        if counter > 1:
-            raise KeyboardInterrupt
-        return original(*args, **kwargs)
-
-    mocker.patch("schemathesis.runner.impl.threadpool.time.sleep", autospec=True, wraps=mocked)
+    class InterruptedQueue(Queue):
+        def get(self, *args, **kwargs):
+            nonlocal counter
+            # Only the main thread receives the signal while waiting for events
+            if threading.current_thread() is threading.main_thread():
+                counter += 1
+                if counter > 1:
+                    raise KeyboardInterrupt
+            return super().get(*args, **kwargs)
+
+    mocker.patch("schemathesis.runner.impl.threadpool.Queue", InterruptedQueue)
     result = cli.run(*cli_args, "--workers=2", "--hypothesis-derandomize")
     # the exit status depends on what thread finished first
     assert result.exit_code in (ExitCode.OK, ExitCode.TESTS_FAILED), result.stdout
@@ -2173,6 +2182,7 @@ def assert_exit_code(event_stream, code):
             cassette_path=None,
             cassette_format=CassetteFormat.VCR,
             cassette_preserve_exact_body_bytes=False,
+            cassette_index=False,
             junit_xml=None,
             verbosity=0,
             code_sample_style=CodeSampleStyle.default(),
@@ -382,6 +382,11 @@ class CliSnapshotConfig:
             data = "\n".join(lines) + "\n"
         if self.replace_stateful_progress:
             data = re.sub(r"(?<=Stateful tests\n\n)([.FES]+)", "...", data)
+        data = re.sub(
+            r"Unique data cache: .+",
+            "Unique data cache: N / N entries, N hits, N evictions, ~N KiB",
+            data,
+        )
         if self.replace_statistic:
             data = re.sub("[0-9]+ / [0-9]+ passed", "N / N passed", data)
             data = re.sub("N / N passed +PASSED", "N / N passed          PASSED", data)
@@ -0,0 +1,102 @@
+import sys
+
+import pytest
+
+from schemathesis.constants import NOT_SET
+from schemathesis.exceptions import CheckFailed
+from schemathesis.runner.outcomes import OutcomeCache
+
+
+def make_failure(message="Failed"):
+    try:
+        raise CheckFailed(message, causes=(AssertionError("Cause"),))
+    except CheckFailed as exc:
+        return exc
+
+
+def test_get_missing():
+    cache = OutcomeCache(capacity=2)
+    assert cache.get(1) is NOT_SET
+    assert cache.get_statistic().misses == 1
+
+
+def test_success():
+    cache = OutcomeCache(capacity=2)
+    cache.put(1, None)
+    assert cache.get(1) is None
+    assert cache.get_statistic().hits == 1
+
+
+def test_failure_is_detached():
+    cache = OutcomeCache(capacity=2)
+    failure = make_failure()
+    cache.put(1, failure)
+    cached = cache.get(1)
+    assert isinstance(cached, CheckFailed)
+    assert cached is not failure
+    assert cached.args == failure.args
+    # No frames are kept alive
+    assert cached.__traceback__ is None
+    assert failure.__traceback__ is not None
+    assert cached.__cause__ is None
+    assert len(cached.causes) == 1
+    assert isinstance(cached.causes[0], AssertionError)
+    assert cached.causes[0].args == ("Cause",)
+    # Every hit gives a new instance that could be raised independently
+    assert cache.get(1) is not cached
+
+
+class CustomError(Exception):
+    def __init__(self, code, *, detail):
+        super().__init__(f"{code}: {detail}")
+        self.code = code
+        self.detail = detail
+
+
+def test_custom_exception_signature():
+    cache = OutcomeCache(capacity=2)
+    cache.put(1, CustomError(42, detail="Oops"))
+    cached = cache.get(1)
+    assert isinstance(cached, CustomError)
+    assert cached.args == ("42: Oops",)
+    assert cached.code == 42
+    assert cached.detail == "Oops"
+
+
+def test_eviction():
+    cache = OutcomeCache(capacity=2)
+    cache.put(1, None)
+    cache.put(2, None)
+    # Mark `1` as recently used
+    assert cache.get(1) is None
+    cache.put(3, None)
+    assert len(cache) == 2
+    assert cache.get(2) is NOT_SET
+    assert cache.get(1) is None
+    assert cache.get(3) is None
+    statistic = cache.get_statistic()
+    assert statistic.size == 2
+    assert statistic.capacity == 2
+    assert statistic.evictions == 1
+
+
+def test_disabled():
+    cache = OutcomeCache(capacity=0)
+    cache.put(1, None)
+    assert cache.get(1) is NOT_SET
+
+
+@pytest.mark.parametrize("outcome", (None, make_failure()))
+def test_memory_usage(outcome):
+    cache = OutcomeCache(capacity=10)
+    empty = cache.memory_usage()
+    assert empty == sys.getsizeof(cache._entries)
+    cache.put(1, outcome)
+    assert cache.memory_usage() > empty
+
+
+def test_memory_usage_includes_context():
+    small, large = OutcomeCache(capacity=10), OutcomeCache(capacity=10)
+    small.put(1, CheckFailed("Failed", context=None))
+    large.put(1, CheckFailed("Failed", context=["x" * 10000]))
+    assert large.memory_usage() - small.memory_usage() > 10000
@@ -3,6 +3,7 @@ from __future__ import annotations
 import base64
 import json
 import platform
+import threading
 from dataclasses import asdict
 from typing import TYPE_CHECKING
 from unittest.mock import ANY
@@ -27,6 +28,7 @@ from schemathesis.generation import DataGenerationMethod, GenerationConfig, Head
 from schemathesis.models import Check, Status, TestResult
 from schemathesis.runner import events, from_schema
 from schemathesis.runner.impl import threadpool
+from schemathesis.runner.impl.context import ALL_NOT_FOUND_WARNING_MESSAGE
 from schemathesis.runner.impl.core import deduplicate_errors, has_too_many_responses_with_status
 from schemathesis.specs.graphql import loaders as gql_loaders
 from schemathesis.specs.openapi import loaders as oas_loaders
@@ -100,6 +102,23 @@ def test_execute_base_url_not_found(openapi3_base_url, schema_url, app):
     assert_incoming_requests_num(app, 0)
 
 
+@pytest.mark.parametrize("unique_data", (True, False))
+def test_outcome_cache_statistic(any_app_schema, unique_data):
+    finished = execute(
+        any_app_schema,
+        unique_data=unique_data,
+        unique_data_cache_size=3,
+        hypothesis_settings=hypothesis.settings(max_examples=5, deadline=None, phases=[Phase.generate]),
+    )
+    if unique_data:
+        assert finished.outcome_cache is not None
+        assert finished.outcome_cache.capacity == 3
+        assert finished.outcome_cache.size <= 3
+        assert finished.outcome_cache.memory_usage > 0
+    else:
+        assert finished.outcome_cache is None
+
+
 def test_execute(any_app, any_app_schema):
     # When the runner is executed against the default test app
     stats = execute(any_app_schema)
@@ -119,9 +138,13 @@ def test_execute(any_app, any_app_schema):
     assert stats.total == {"not_a_server_error": {Status.success: 1, Status.failure: 2, "total": 3}}
 
 
-@pytest.mark.parametrize("workers", (1, 2))
-def test_interactions(request, any_app_schema, workers):
-    _, *others, _ = from_schema(any_app_schema, workers_num=workers, store_interactions=True).execute()
+@pytest.mark.parametrize(
+    "workers, workers_mode", ((1, "threads"), (2, "threads"), (2, "asyncio"), (2, "processes"))
+)
+def test_interactions(request, any_app_schema, workers, workers_mode):
+    _, *others, _ = from_schema(
+        any_app_schema, workers_num=workers, workers_mode=workers_mode, store_interactions=True
+    ).execute()
     base_url = (
         "http://localhost/api"
         if isinstance(any_app_schema.app, Flask)
@@ -1003,6 +1026,102 @@ def test_connection_error(empty_open_api_3_schema):
     assert len(after.result.errors) == 1
 
 
+def test_connection_error_asyncio(empty_open_api_3_schema):
+    empty_open_api_3_schema["paths"] = {"/success": {"post": {"responses": {"200": {"description": "OK"}}}}}
+    schema = oas_loaders.from_dict(empty_open_api_3_schema, base_url="http://127.0.0.1:1")
+    *_, after, finished = from_schema(
+        schema,
+        workers_num=2,
+        workers_mode="asyncio",
+        hypothesis_settings=hypothesis.settings(max_examples=1, deadline=None),
+    ).execute()
+    # Then network errors are reported the same way as with `requests`
+    assert finished.has_errors
+    assert "ConnectionError" in after.result.errors[0].exception
+    assert len(after.result.errors) == 1
+
+
+@pytest.mark.operations("success", "failure", "slow")
+def test_asyncio_runner(real_app_schema):
+    # When requests are sent via the event loop
+    threads = execute(real_app_schema, workers_num=2, hypothesis_settings=hypothesis.settings(max_examples=5))
+    stats = execute(
+        real_app_schema,
+        workers_num=2,
+        workers_mode="asyncio",
+        hypothesis_settings=hypothesis.settings(max_examples=5),
+    )
+    # Then the results are the same as with threads
+    assert stats.passed_count == threads.passed_count
+    assert stats.failed_count == threads.failed_count
+    assert stats.errored_count == threads.errored_count
+
+
+@pytest.mark.operations("success", "failure", "slow")
+def test_asyncio_runner_stop(real_app_schema):
+    event_stream = from_schema(real_app_schema, workers_num=2, workers_mode="asyncio").execute()
+    for event in event_stream:
+        if isinstance(event, events.BeforeExecution):
+            break
+    event_stream.stop()
+    # Then in-flight requests are cancelled, and the next event is the last one
+    assert isinstance(next(event_stream), events.Finished)
+    assert next(event_stream, None) is None
+
+
+@pytest.mark.operations("success", "failure", "slow", "unsatisfiable")
+def test_processes_runner(real_app_schema):
+    # When operations are spread among worker processes
+    threads = execute(real_app_schema, workers_num=2, hypothesis_settings=hypothesis.settings(max_examples=5))
+    stats = execute(
+        real_app_schema,
+        workers_num=2,
+        workers_mode="processes",
+        hypothesis_settings=hypothesis.settings(max_examples=5),
+    )
+    # Then results from all workers are merged into the same summary as with threads
+    assert stats.passed_count == threads.passed_count
+    assert stats.failed_count == threads.failed_count
+    assert stats.errored_count == threads.errored_count
+
+
+@pytest.mark.operations("success", "failure")
+def test_processes_runner_unique_data(real_app_schema):
+    stats = execute(
+        real_app_schema,
+        workers_num=2,
+        workers_mode="processes",
+        unique_data=True,
+        hypothesis_settings=hypothesis.settings(max_examples=5),
+    )
+    # Then the outcome cache usage includes all worker processes
+    assert stats.outcome_cache is not None
+    assert stats.outcome_cache.misses > 0
+    assert stats.outcome_cache.size > 0
+
+
+@pytest.mark.operations("success", "failure")
+def test_processes_runner_all_not_found(openapi3_base_url, schema_url):
+    schema = oas_loaders.from_uri(schema_url, base_url=f"{openapi3_base_url}/404/")
+    finished = execute(
+        schema, workers_num=2, workers_mode="processes", hypothesis_settings=hypothesis.settings(max_examples=1)
+    )
+    # Then warnings are based on the results from all workers
+    assert finished.warnings == [ALL_NOT_FOUND_WARNING_MESSAGE]
+
+
+@pytest.mark.operations("success", "failure", "slow")
+def test_processes_runner_stop(real_app_schema):
+    event_stream = from_schema(real_app_schema, workers_num=2, workers_mode="processes").execute()
+    for event in event_stream:
+        if isinstance(event, events.BeforeExecution):
+            break
+    event_stream.stop()
+    # Then workers are terminated, and the next event is the last one
+    assert isinstance(next(event_stream), events.Finished)
+    assert next(event_stream, None) is None
+
+
 @pytest.mark.operations("reserved")
 def test_reserved_characters_in_operation_name(any_app_schema):
     # See GH-992
@@ -1189,6 +1308,28 @@ def test_stop_event_stream_after_second_event(event_stream, workers_num, stop_wo
         stop_worker.assert_called()
 
 
+@pytest.mark.operations("success", "slow")
+def test_idle_workers_exit(real_app_schema):
+    # When there are more workers than API operations
+    execute(real_app_schema, workers_num=4)
+    # Then workers without tasks don't wait for new ones after the run is finished
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("schemathesis_")]
+
+
+@pytest.mark.operations("success", "slow")
+def test_stop_idle_workers(real_app_schema, stop_worker):
+    event_stream = from_schema(real_app_schema, workers_num=4).execute()
+    for event in event_stream:
+        if isinstance(event, events.BeforeExecution):
+            break
+    # When the run is stopped while some workers are waiting for tasks
+    event_stream.stop()
+    assert isinstance(next(event_stream), events.Finished)
+    # Then all workers are stopped
+    stop_worker.assert_called()
+    assert not [thread for thread in threading.enumerate() if thread.name.startswith("schemathesis_")]
+
+
 def test_finish(event_stream):
     assert isinstance(next(event_stream), events.Initialized)
     event = event_stream.finish()
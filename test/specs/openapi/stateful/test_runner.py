@@ -135,6 +135,29 @@ def test_find_independent_5xx(runner_factory, kwargs):
     assert_linked_calls_followed(result)
 
 
+@pytest.mark.parametrize("kwargs", ({"exit_first": False}, {"exit_first": True}))
+def test_find_independent_5xx_multiple_workers(runner_factory, kwargs):
+    # When state machines are executed by multiple workers
+    runner = runner_factory(app_kwargs={"independent_500": True}, config_kwargs={"workers_num": 3, **kwargs})
+    result = collect_result(runner)
+    import traceback
+    for e in result.errors:
+        traceback.print_exception(e.exception)
+    assert result.events[-1].status == events.RunStatus.FAILURE, result.errors
+    # Then every worker runs its own suites
+    assert result.event_names.count("SuiteStarted") >= 3
+    # And each failure is reported only once
+    operations = [check.example.operation.verbose_name for check in result.failures]
+    assert len(operations) == len(set(operations))
+    if kwargs["exit_first"]:
+        # Other workers are stopped after the first failure, but they may find another one at the same time
+        assert 1 <= len(operations) <= 2
+    else:
+        assert len(operations) == 2
+    assert result.sink.failures == result.failures
+    serialize_all_events(result.events)
+
+
 def test_works_on_single_link(runner_factory):
     runner = runner_factory(app_kwargs={"single_link": True, "independent_500": True})
     result = collect_result(runner)
@@ -697,6 +720,31 @@ def test_unique_data(runner_factory):
             assert event.status == events.RunStatus.FAILURE
 
 
+def test_unique_data_with_links(runner_factory):
+    # Steps that are generated the same way but receive different data from links are not duplicates
+    runner = runner_factory(
+        config_kwargs={
+            "unique_data": True,
+            "hypothesis_settings": hypothesis.settings(max_examples=30, database=None, stateful_step_count=50),
+        },
+    )
+    executed = set()
+    linked = 0
+    for event in runner.execute():
+        if isinstance(event, events.ScenarioStarted):
+            executed.clear()
+        elif isinstance(event, events.StepFinished):
+            # A copy has its own fingerprint that reflects the data sent over the network
+            key = hash(event.case.partial_deepcopy())
+            if event.response is None:
+                # Skipped as an already tested case
+                assert key in executed
+            else:
+                executed.add(key)
+                linked += event.transition_id is not None
+    assert linked > 0
+
+
 def test_ignored_auth_valid(runner_factory):
     # When auth works properly
     token = "Test"
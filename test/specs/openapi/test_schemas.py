@@ -1,9 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 import pytest
 from hypothesis import find
 
 import schemathesis
+from schemathesis.exceptions import CheckFailed
 from schemathesis.models import APIOperation
 from schemathesis.specs.openapi.parameters import OpenAPI20Parameter, OpenAPI30Parameter
 
@@ -100,3 +102,66 @@ def test_schema_as_strategy(empty_open_api_3_schema):
         for operation in operations.values():
             # All operations should be possible to generate
             find(strategy, partial(matches_operation, operation=operation))
+
+
+RESPONSE_VALIDATION_PATHS = {
+    "/users": {
+        "get": {
+            "responses": {
+                "200": {
+                    "description": "OK",
+                    "content": {"application/json": {"schema": {"$ref": "#/components/schemas/User"}}},
+                },
+                "default": {"description": "Error"},
+            }
+        }
+    }
+}
+RESPONSE_VALIDATION_COMPONENTS = {
+    "schemas": {
+        "User": {
+            "type": "object",
+            "properties": {"id": {"type": "integer"}, "friend": {"$ref": "#/components/schemas/User"}},
+            "required": ["id"],
+        }
+    }
+}
+
+
+def test_response_validator_cache(empty_open_api_3_schema, response_factory, mocker):
+    empty_open_api_3_schema["paths"] = RESPONSE_VALIDATION_PATHS
+    empty_open_api_3_schema["components"] = RESPONSE_VALIDATION_COMPONENTS
+    schema = schemathesis.from_dict(empty_open_api_3_schema)
+    operation = schema["/users"]["GET"]
+    get_response_schema = mocker.spy(schema, "get_response_schema")
+    valid = response_factory.requests(content=b'{"id": 1, "friend": {"id": 2}}')
+    invalid = response_factory.requests(content=b'{"id": 1, "friend": {"id": "2"}}')
+    for _ in range(3):
+        operation.validate_response(valid)
+        with pytest.raises(CheckFailed):
+            operation.validate_response(invalid)
+    # The response schema is compiled only once
+    assert get_response_schema.call_count == 1
+    # Responses without schemas are cached too
+    for _ in range(3):
+        operation.validate_response(response_factory.requests(status_code=500))
+    assert get_response_schema.call_count == 2
+
+
+def test_response_validator_threads(empty_open_api_3_schema, response_factory):
+    empty_open_api_3_schema["paths"] = RESPONSE_VALIDATION_PATHS
+    empty_open_api_3_schema["components"] = RESPONSE_VALIDATION_COMPONENTS
+    schema = schemathesis.from_dict(empty_open_api_3_schema)
+    operation = schema["/users"]["GET"]
+    valid = response_factory.requests(content=b'{"id": 1, "friend": {"id": 2, "friend": {"id": 3}}}')
+    invalid = response_factory.requests(content=b'{"id": 1, "friend": {"id": 2, "friend": {"id": "3"}}}')
+
+    def validate(idx):
+        if idx % 2:
+            return operation.validate_response(valid)
+        with pytest.raises(CheckFailed):
+            operation.validate_response(invalid)
+
+    # The same compiled validator is used from multiple threads and references are resolved properly in all of them
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(validate, range(200)))
@@ -253,3 +253,27 @@ def test_events(setup):
 
     assert data["startup"] == 1
     assert data["shutdown"] == 1
+
+
+@pytest.mark.parametrize("workers_num", (1, 2))
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_runner_lifespan(workers_num):
+    # The app's lifespan should run once per worker, not for every request
+    data = {}
+    app = with_lifespan(data)
+    calls = []
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        calls.append(item_id)
+        return {"id": item_id}
+
+    schema = schemathesis.from_asgi("/openapi.json", app, force_schema_version="30")
+    runner = schemathesis.runner.from_schema(
+        schema, workers_num=workers_num, hypothesis_settings=settings(max_examples=10, deadline=None)
+    )
+    for _ in runner.execute():
+        pass
+
+    assert len(calls) > workers_num
+    assert data["startup"] == data["shutdown"] == workers_num
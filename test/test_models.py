@@ -1,4 +1,6 @@
+import base64
 import json
+import pickle
 import re
 from unittest.mock import ANY
 
@@ -12,6 +14,7 @@ from schemathesis.constants import NOT_SET, SCHEMATHESIS_TEST_CASE_HEADER, USER_
 from schemathesis.exceptions import CheckFailed, UsageError
 from schemathesis.generation import DataGenerationMethod
 from schemathesis.models import APIOperation, Case, CaseSource, Request, Response, TransitionId
+from schemathesis.serializers import Binary
 from schemathesis.specs.openapi.checks import content_type_conformance, response_schema_conformance
 from schemathesis.transports import WSGITransport, _merge_dict_to
 
@@ -298,6 +301,70 @@ def test_case_partial_deepcopy_same_generated_code(swagger_20):
     ) == copied_case.as_curl_command().replace(f" -H '{SCHEMATHESIS_TEST_CASE_HEADER}: {copied_case.id}'", "")
 
 
+@pytest.mark.parametrize(
+    "first, second",
+    (
+        ({"query": {"a": 1, "b": 2}}, {"query": {"b": 2, "a": 1}}),
+        ({"headers": {"X-Token": "foo"}}, {"headers": {"x-token": "foo"}}),
+        # Rendered the same way in the URL
+        ({"query": {"a": 1}}, {"query": {"a": "1"}}),
+        ({"query": {"a": 1, "b": None}}, {"query": {"a": 1}}),
+        (
+            {"body": {"a": 1}, "media_type": "application/x-www-form-urlencoded"},
+            {"body": {"a": "1"}, "media_type": "application/x-www-form-urlencoded"},
+        ),
+        (
+            {"body": {"a": [1, {"b": None}]}, "media_type": "application/json"},
+            {"body": {"a": [1, {"b": None}]}, "media_type": "application/json"},
+        ),
+    ),
+)
+def test_case_hash_equal(swagger_20, first, second):
+    operation = APIOperation("/users", "POST", {}, swagger_20)
+    assert hash(operation.make_case(**first)) == hash(operation.make_case(**second))
+
+
+@pytest.mark.parametrize(
+    "first, second",
+    (
+        ({"query": {"a": 1}}, {"query": {"a": 2}}),
+        ({"query": {"a": 1}}, {"headers": {"a": 1}}),
+        ({"query": {"a": 1, "b": 2}}, {"query": {"a": 2, "b": 1}}),
+        ({"body": {"a": 1}, "media_type": "application/json"}, {"body": {"a": "1"}, "media_type": "application/json"}),
+        ({"body": {"a": 1}, "media_type": "application/json"}, {"body": {"a": True}, "media_type": "application/json"}),
+        ({"body": {"a": 1}, "media_type": "application/json"}, {"body": {"a": 1.0}, "media_type": "application/json"}),
+        ({"body": {}, "media_type": "application/json"}, {"body": [], "media_type": "application/json"}),
+        ({"body": None, "media_type": "application/json"}, {"media_type": "application/json"}),
+        ({"body": [1, 2], "media_type": "application/json"}, {"body": [2, 1], "media_type": "application/json"}),
+        ({"body": [1], "media_type": "application/json"}, {"body": [1], "media_type": "application/xml"}),
+    ),
+)
+def test_case_hash_different(swagger_20, first, second):
+    operation = APIOperation("/users", "POST", {}, swagger_20)
+    assert hash(operation.make_case(**first)) != hash(operation.make_case(**second))
+
+
+def test_case_hash_binary(swagger_20):
+    operation = APIOperation("/users", "POST", {}, swagger_20)
+
+    def make_case(data):
+        return operation.make_case(body={"data": Binary(data)}, media_type="multipart/form-data")
+
+    # Binary data in multipart payloads is not hashable by itself
+    assert hash(make_case(b"a")) == hash(make_case(b"a"))
+    assert hash(make_case(b"a")) != hash(make_case(b"b"))
+
+
+def test_case_hash_memoized(swagger_20):
+    operation = APIOperation("/users", "POST", {}, swagger_20)
+    case = operation.make_case(query={"a": 1})
+    value = hash(case)
+    case.query["a"] = 2
+    assert hash(case) == value
+    # A copy has its own fingerprint
+    assert hash(case.partial_deepcopy()) != value
+
+
 def test_case_partial_deepcopy_source(swagger_20):
     operation = APIOperation("/example/path", "GET", {}, swagger_20)
     original_case = Case(operation=operation, generation_time=0.0)
@@ -432,6 +499,23 @@ def test_response_from_requests(base_url):
     assert serialized.headers["Set-Cookie"] == ["foo=bar; Path=/", "baz=spam; Path=/"]
 
 
+@pytest.mark.operations("success")
+def test_response_lazy_body(base_url):
+    response = requests.get(f"{base_url}/success", timeout=1)
+    serialized = Response.from_requests(response)
+    # Raw bytes are returned without encoding them first
+    assert serialized.deserialize_body() is response.content
+    assert "_body" not in serialized.__dict__
+    assert serialized.body == base64.b64encode(response.content).decode()
+    assert serialized.body_size == len(response.content)
+    # Pickling keeps raw bytes, e.g. for the process pool runner
+    restored = pickle.loads(pickle.dumps(serialized))
+    assert restored == serialized
+    # Assigning a base64 string replaces raw bytes
+    serialized.body = base64.b64encode(b"foo").decode()
+    assert serialized.deserialize_body() == b"foo"
+
+
 @pytest.mark.parametrize("body, expected", ((NOT_SET, None), (b"example", b"example")))
 def test_from_case(swagger_20, body, expected):
     operation = APIOperation("/users/{name}", "GET", {}, swagger_20, base_url="http://127.0.0.1/api/v3")
@@ -448,6 +532,31 @@ def test_from_case(swagger_20, body, expected):
     assert request.uri == "http://127.0.0.1/api/v3/users/test"
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {"body": {"id": 42}, "media_type": "application/json"},
+        {"body": {"id": "42"}, "media_type": "application/x-www-form-urlencoded"},
+        {"query": {"q": "foo"}, "cookies": {"session": "bar"}, "headers": {"X-Key": "spam"}},
+    ),
+)
+def test_from_case_without_session(swagger_20, kwargs):
+    # When a request is stored without a session
+    operation = APIOperation("/users", "POST", {}, swagger_20, base_url="http://127.0.0.1/api/v3")
+    case = operation.make_case(**kwargs)
+    headers = {"User-Agent": USER_AGENT, "Authorization": "Bearer token"}
+    session = requests.Session()
+    session.headers.update(headers)
+    expected = Request.from_case(case, session)
+    # Then it should be the same as one prepared via a session with the same headers
+    request = Request.from_case(case, headers=headers)
+    assert request.headers == expected.headers
+    assert list(request.headers) == list(expected.headers)
+    assert request.deserialize_body() == expected.deserialize_body()
+    assert request.uri == expected.uri
+    assert request.method == expected.method
+
+
 @pytest.mark.parametrize(
     "value, message",
     (